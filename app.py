@@ -13,22 +13,57 @@ Sections:
   7. PDF download
 """
 
-import time
-import json
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 import streamlit as st
+from streamlit_autorefresh import st_autorefresh
 from pathlib import Path
 
+from config import settings
+
 # ---------------------------------------------------------------------------
 # Config
 # ---------------------------------------------------------------------------
 
-API_URL    = "http://localhost:8000"
-API_KEY    = "sk-advisor-demo-001"
-HEADERS    = {"X-API-Key": API_KEY}
+API_URL    = settings.api_url
+HEADERS    = {"X-API-Key": settings.api_key}
+
+# Status polling: st_autorefresh schedules reruns, backing off while nothing
+# changes; each status request may be held briefly for a progress change
+LONG_POLL_WAIT    = 2      # seconds; the request blocks the script thread
+POLL_INTERVAL_MIN = 0.3
+POLL_INTERVAL_MAX = 5.0
+POLL_BACKOFF      = 1.5
+
+
+@st.cache_resource
+def http() -> requests.Session:
+    """One pooled keep-alive session shared by every dashboard user and rerun."""
+    s = requests.Session()
+    s.headers.update(HEADERS)
+    s.mount("http://", HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        # read=0: a timed-out long-poll is not re-sent, so a stalled API costs one
+        # timeout per rerun rather than four plus backoff
+        max_retries=Retry(total=3, read=0, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+    ))
+    return s
+
+
+@st.cache_resource
+def prefetch_pool() -> ThreadPoolExecutor:
+    """Background downloads (PDF prefetch) that must not hold up the script run; one pool per process."""
+    return ThreadPoolExecutor(max_workers=4)
+
+# Charts are display-only: no mode bar
+PLOTLY_CONFIG = {"displayModeBar": False, "staticPlot": False, "responsive": True}
 
 MATURITY_COLORS = {
     "Nascent":    "#ef4444",
@@ -54,19 +89,55 @@ if "report" not in st.session_state:
     st.session_state.report = None
 if "polling" not in st.session_state:
     st.session_state.polling = False
+if "pdf_bytes" not in st.session_state:
+    st.session_state.pdf_bytes = None
+if "pdf_future" not in st.session_state:
+    st.session_state.pdf_future = None
+if "poll_interval" not in st.session_state:
+    st.session_state.poll_interval = POLL_INTERVAL_MIN
+if "last_pct" not in st.session_state:
+    st.session_state.last_pct = 0
+if "last_status_hash" not in st.session_state:
+    st.session_state.last_status_hash = None
+
+
+def reset_polling():
+    st.session_state.poll_interval = POLL_INTERVAL_MIN
+    st.session_state.last_pct = 0
+    st.session_state.last_status_hash = None
 
 
 # ---------------------------------------------------------------------------
-# Helper: radar chart
+# Helper: one-shot report normalisation
 # ---------------------------------------------------------------------------
 
-def render_radar(report: dict):
-    scores = report["dimension_scores"]
-    dims   = [s["dimension"] for s in scores]
-    vals   = [s["score"] for s in scores]
+def short_label(dimension: str) -> str:
+    """'Talent & Skills' -> 'Talent'; split at most once per separator."""
+    return dimension.split(" & ", 1)[0].split(" ", 1)[0]
+
+
+def prepare_report(report: dict) -> dict:
+    """
+    Derives everything the results page would otherwise recompute per rerun.
+    Underscore-prefixed keys are display-only and stripped from the JSON download.
+    """
+    # Sort once here so the results page can iterate in rank order
+    report["use_case_candidates"].sort(key=lambda x: x["priority_rank"])
+    for ds in report["dimension_scores"]:
+        ds["_color"] = MATURITY_COLORS.get(ds["maturity_level"], "#3b82f6")
+        ds["_short"] = short_label(ds["dimension"])
+    report["_overall_color"] = MATURITY_COLORS.get(report["overall_maturity"], "#3b82f6")
+    return report
+
+
+# ---------------------------------------------------------------------------
+# Helper: radar chart
+# ---------------------------------------------------------------------------
 
-    # Short labels for radar
-    short_labels = [d.split(" & ")[0].split(" ")[0] for d in dims]
+@st.cache_data(ttl=3600, show_spinner=False)
+def render_radar(short_labels: tuple[str, ...], vals: tuple[float, ...]) -> go.Figure:
+    short_labels = list(short_labels)
+    vals = list(vals)
 
     fig = go.Figure()
     fig.add_trace(go.Scatterpolar(
@@ -125,6 +196,116 @@ def render_roadmap_gantt(phases: list[dict]):
     return fig
 
 
+# ---------------------------------------------------------------------------
+# Helper: use case table
+# ---------------------------------------------------------------------------
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_use_case_table(use_cases: tuple[tuple[int, str, str, str, str], ...]) -> pd.DataFrame:
+    """use_cases: (priority rank, title, AI approach, complexity, ROI impact) per candidate."""
+    return pd.DataFrame({
+        "Priority":    [f"#{uc[0]}" for uc in use_cases],
+        "Use Case":    [uc[1] for uc in use_cases],
+        "AI Approach": [uc[2] for uc in use_cases],
+        "Complexity":  [uc[3] for uc in use_cases],
+        "ROI Impact":  [uc[4] for uc in use_cases],
+    })
+
+
+# ---------------------------------------------------------------------------
+# Helper: prefetched PDF
+# ---------------------------------------------------------------------------
+
+def prefetched_pdf() -> bytes | None:
+    """Returns the prefetched PDF once its background download has finished."""
+    fut = st.session_state.pdf_future
+    if st.session_state.pdf_bytes is None and fut is not None and fut.done():
+        st.session_state.pdf_future = None
+        try:
+            r = fut.result()
+            st.session_state.pdf_bytes = r.content if r.ok else None
+        except Exception:
+            pass  # Fetched on demand instead
+    return st.session_state.pdf_bytes
+
+
+# ---------------------------------------------------------------------------
+# Helper: JSON download payload
+# ---------------------------------------------------------------------------
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def report_json_bytes(session_id: str, _report: dict) -> bytes:
+    """Serialised once per session; the leading underscore keeps the report out of the cache key."""
+    public = {k: v for k, v in _report.items() if not k.startswith("_")}
+    public["dimension_scores"] = [
+        {k: v for k, v in ds.items() if not k.startswith("_")}
+        for ds in _report["dimension_scores"]
+    ]
+    return orjson.dumps(public, option=orjson.OPT_INDENT_2)
+
+
+# ---------------------------------------------------------------------------
+# Fragments: repeating report sections rerun on their own when interacted with
+# ---------------------------------------------------------------------------
+
+@st.fragment
+def render_dimension_analysis(dimension_scores: list[dict]):
+    for ds in dimension_scores:
+        score = ds["score"]
+        mat   = ds["maturity_level"]
+        color = ds["_color"]
+
+        with st.expander(f"**{ds['dimension']}** — {score}/10  ·  {mat}", expanded=False):
+            st.progress(score / 10)
+
+            s_col, g_col = st.columns(2)
+            with s_col:
+                st.markdown("**✅ Strengths**")
+                st.markdown("\n".join(f"- {s}" for s in ds["key_strengths"]))
+            with g_col:
+                st.markdown("**❌ Gaps**")
+                st.markdown("\n".join(f"- {g}" for g in ds["key_gaps"]))
+
+            if ds.get("recommendations"):
+                st.markdown("**💡 Recommendations**")
+                st.markdown("\n\n".join(f"→ {r}" for r in ds["recommendations"]))
+
+            if ds.get("evidence_excerpts"):
+                st.caption("Evidence from documents:")
+                st.caption("\n\n".join(f'_"{ex}"_' for ex in ds["evidence_excerpts"]))
+
+
+@st.fragment
+def render_use_cases(use_case_candidates: list[dict]):
+    """use_case_candidates must already be sorted by priority_rank."""
+    uc_df = build_use_case_table(tuple(
+        (uc["priority_rank"], uc["title"], uc["ai_approach"],
+         uc["estimated_complexity"], uc["estimated_roi_impact"])
+        for uc in use_case_candidates
+    ))
+
+    st.dataframe(
+        uc_df,
+        use_container_width=True,
+        column_config={
+            "Priority": st.column_config.TextColumn(width="small"),
+            "ROI Impact": st.column_config.TextColumn(width="small"),
+            "Complexity": st.column_config.TextColumn(width="small"),
+        },
+        hide_index=True,
+    )
+
+    # Detail cards
+    for uc in use_case_candidates:
+        with st.expander(f"#{uc['priority_rank']} — {uc['title']}"):
+            st.markdown(uc["description"])
+            st.markdown(f"**Process:** {uc['business_process']}")
+            st.markdown(f"**AI Approach:** `{uc['ai_approach']}`")
+            if uc.get("prerequisites"):
+                st.markdown("**Prerequisites:**")
+                st.markdown("\n".join(f"- {p}" for p in uc["prerequisites"]))
+
+
 # ---------------------------------------------------------------------------
 # Pages
 # ---------------------------------------------------------------------------
@@ -158,12 +339,12 @@ def page_upload():
 
     if uploaded_files and st.button("▶ Start Assessment", type="primary", use_container_width=True):
         with st.spinner("Uploading documents..."):
-            files = [("files", (f.name, f.read(), f.type)) for f in uploaded_files]
+            # requests reads each UploadedFile itself while encoding the multipart body
+            files = [("files", (f.name, f, f.type)) for f in uploaded_files]
             data  = {"organisation_name": org_name, "additional_context": context}
             try:
-                resp = requests.post(
+                resp = http().post(
                     f"{API_URL}/v1/assessment/upload",
-                    headers=HEADERS,
                     files=files,
                     data=data,
                     timeout=30,
@@ -173,6 +354,9 @@ def page_upload():
                     st.session_state.session_id = result["session_id"]
                     st.session_state.polling = True
                     st.session_state.report = None
+                    st.session_state.pdf_bytes = None
+                    st.session_state.pdf_future = None
+                    reset_polling()
                     st.rerun()
                 else:
                     st.error(f"Upload failed: {resp.text}")
@@ -198,39 +382,75 @@ def page_progress():
     st.title("⏳ Assessment In Progress")
     session_id = st.session_state.session_id
 
-    placeholder = st.empty()
-    progress_bar = st.progress(0)
+    progress_bar = st.progress(st.session_state.last_pct / 100)
     status_text  = st.empty()
 
-    while st.session_state.polling:
-        try:
-            resp = requests.get(f"{API_URL}/v1/assessment/{session_id}", headers=HEADERS, timeout=5)
-            if resp.ok:
-                data = resp.json()
-                pct  = data.get("progress_pct", 0)
-                step = data.get("current_step", "Processing...")
-
-                progress_bar.progress(pct / 100)
-                status_text.info(f"**Step:** {step}")
-
-                if data["status"] == "complete":
-                    # Fetch full report
-                    rr = requests.get(f"{API_URL}/v1/assessment/{session_id}/json", headers=HEADERS, timeout=10)
-                    if rr.ok:
-                        st.session_state.report = rr.json()
-                    st.session_state.polling = False
-                    st.rerun()
-
-                elif data["status"] == "error":
-                    st.error(f"Assessment failed: {data.get('error')}")
-                    st.session_state.polling = False
-                    break
-
-        except Exception as e:
-            status_text.warning(f"Waiting for API... ({e})")
+    try:
+        # Short long-poll: the API may hold the request for up to LONG_POLL_WAIT
+        # seconds until progress moves past since_pct. Kept short because widget
+        # interactions wait behind it; st_autorefresh sets the polling rhythm.
+        resp = http().get(
+            f"{API_URL}/v1/assessment/{session_id}",
+            params={"wait": LONG_POLL_WAIT, "since_pct": st.session_state.last_pct},
+            timeout=LONG_POLL_WAIT + 5,
+        )
+        if resp.ok:
+            data = resp.json()
+            pct  = data.get("progress_pct", 0)
+            step = data.get("current_step", "Processing...")
+
+            progress_bar.progress(pct / 100)
+            status_text.info(f"**Step:** {step}")
+
+            if data["status"] == "complete":
+                # Start the PDF download in the background, then fetch the full
+                # report; the results page renders without waiting for the PDF
+                st.session_state.pdf_future = prefetch_pool().submit(
+                    http().get, f"{API_URL}/v1/assessment/{session_id}/pdf", timeout=15
+                )
+                rr = http().get(f"{API_URL}/v1/assessment/{session_id}/json", timeout=10)
+                if rr.ok:
+                    st.session_state.report = prepare_report(rr.json())
+                st.session_state.polling = False
+                st.rerun()
+
+            elif data["status"] == "error":
+                st.error(f"Assessment failed: {data.get('error')}")
+                st.session_state.polling = False
+                return
+
+            # Back off while nothing changes; snap back as soon as it does
+            status_hash = hash((data["status"], pct, step))
+            if status_hash == st.session_state.last_status_hash:
+                st.session_state.poll_interval = min(
+                    POLL_INTERVAL_MAX, st.session_state.poll_interval * POLL_BACKOFF
+                )
+            else:
+                st.session_state.poll_interval = POLL_INTERVAL_MIN
+            st.session_state.last_status_hash = status_hash
+            st.session_state.last_pct = pct
+
+        elif resp.status_code == 404:
+            # The session is gone (e.g. API restarted) — polling again cannot succeed
+            st.error("Assessment session not found. Please start a new assessment.")
+            st.session_state.polling = False
+            return
+
+        else:
+            status_text.warning(f"Waiting for API... (HTTP {resp.status_code})")
+            st.session_state.poll_interval = min(
+                POLL_INTERVAL_MAX, st.session_state.poll_interval * POLL_BACKOFF
+            )
+
+    except Exception as e:
+        status_text.warning(f"Waiting for API... ({e})")
+        st.session_state.poll_interval = min(
+            POLL_INTERVAL_MAX, st.session_state.poll_interval * POLL_BACKOFF
+        )
 
-        time.sleep(3)
-        st.rerun()
+    # Only still-running assessments get another script run. The browser
+    # schedules it, so no script thread sits in time.sleep between polls.
+    st_autorefresh(interval=int(st.session_state.poll_interval * 1000), key="asmt_poll")
 
 
 def page_results():
@@ -244,7 +464,7 @@ def page_results():
     # -----------------------------------------------------------------------
     overall = report["overall_score"]
     maturity = report["overall_maturity"]
-    mat_color = MATURITY_COLORS.get(maturity, "#3b82f6")
+    mat_color = report["_overall_color"]
 
     st.markdown(
         f"<h1 style='margin-bottom:0'>🧠 AI Readiness Report</h1>"
@@ -272,16 +492,16 @@ def page_results():
         qw_col, cb_col = st.columns(2)
         with qw_col:
             st.markdown("**⚡ Quick Wins**")
-            for qw in report["quick_wins"]:
-                st.markdown(f"✓ {qw}")
+            st.markdown("\n\n".join(f"✓ {qw}" for qw in report["quick_wins"]))
         with cb_col:
             st.markdown("**🚧 Critical Blockers**")
-            for cb in report["critical_blockers"]:
-                st.markdown(f"✗ {cb}")
+            st.markdown("\n\n".join(f"✗ {cb}" for cb in report["critical_blockers"]))
 
     with right:
         st.subheader("🕸️ Readiness Radar")
-        st.plotly_chart(render_radar(report), use_container_width=True)
+        labels = tuple(s["_short"] for s in report["dimension_scores"])
+        vals   = tuple(s["score"] for s in report["dimension_scores"])
+        st.plotly_chart(render_radar(labels, vals), use_container_width=True, config=PLOTLY_CONFIG)
 
     st.divider()
 
@@ -290,33 +510,7 @@ def page_results():
     # -----------------------------------------------------------------------
     st.subheader("📊 Dimension Analysis")
 
-    for ds in report["dimension_scores"]:
-        score = ds["score"]
-        mat   = ds["maturity_level"]
-        color = MATURITY_COLORS.get(mat, "#3b82f6")
-
-        with st.expander(f"**{ds['dimension']}** — {score}/10  ·  {mat}", expanded=False):
-            st.progress(score / 10)
-
-            s_col, g_col = st.columns(2)
-            with s_col:
-                st.markdown("**✅ Strengths**")
-                for s in ds["key_strengths"]:
-                    st.markdown(f"- {s}")
-            with g_col:
-                st.markdown("**❌ Gaps**")
-                for g in ds["key_gaps"]:
-                    st.markdown(f"- {g}")
-
-            if ds.get("recommendations"):
-                st.markdown("**💡 Recommendations**")
-                for r in ds["recommendations"]:
-                    st.markdown(f"→ {r}")
-
-            if ds.get("evidence_excerpts"):
-                st.caption("Evidence from documents:")
-                for ex in ds["evidence_excerpts"]:
-                    st.caption(f'_"{ex}"_')
+    render_dimension_analysis(report["dimension_scores"])
 
     st.divider()
 
@@ -325,39 +519,7 @@ def page_results():
     # -----------------------------------------------------------------------
     st.subheader("🎯 AI Use Case Candidates")
 
-    uc_rows = []
-    for uc in sorted(report["use_case_candidates"], key=lambda x: x["priority_rank"]):
-        uc_rows.append({
-            "Priority": f"#{uc['priority_rank']}",
-            "Use Case": uc["title"],
-            "AI Approach": uc["ai_approach"],
-            "Complexity": uc["estimated_complexity"],
-            "ROI Impact": uc["estimated_roi_impact"],
-        })
-
-    uc_df = pd.DataFrame(uc_rows)
-
-    st.dataframe(
-        uc_df,
-        use_container_width=True,
-        column_config={
-            "Priority": st.column_config.TextColumn(width="small"),
-            "ROI Impact": st.column_config.TextColumn(width="small"),
-            "Complexity": st.column_config.TextColumn(width="small"),
-        },
-        hide_index=True,
-    )
-
-    # Detail cards
-    for uc in sorted(report["use_case_candidates"], key=lambda x: x["priority_rank"]):
-        with st.expander(f"#{uc['priority_rank']} — {uc['title']}"):
-            st.markdown(uc["description"])
-            st.markdown(f"**Process:** {uc['business_process']}")
-            st.markdown(f"**AI Approach:** `{uc['ai_approach']}`")
-            if uc.get("prerequisites"):
-                st.markdown("**Prerequisites:**")
-                for p in uc["prerequisites"]:
-                    st.markdown(f"- {p}")
+    render_use_cases(report["use_case_candidates"])
 
     st.divider()
 
@@ -381,16 +543,13 @@ def page_results():
         p1, p2, p3 = st.columns(3)
         with p1:
             st.markdown("**Initiatives**")
-            for i in phase["key_initiatives"]:
-                st.markdown(f"- {i}")
+            st.markdown("\n".join(f"- {i}" for i in phase["key_initiatives"]))
         with p2:
             st.markdown("**Success Metrics**")
-            for m in phase["success_metrics"]:
-                st.markdown(f"- {m}")
+            st.markdown("\n".join(f"- {m}" for m in phase["success_metrics"]))
         with p3:
             st.markdown("**Dependencies**")
-            for d in phase.get("dependencies", []):
-                st.markdown(f"- {d}")
+            st.markdown("\n".join(f"- {d}" for d in phase.get("dependencies", [])))
 
     st.divider()
 
@@ -398,21 +557,34 @@ def page_results():
     # Downloads
     # -----------------------------------------------------------------------
     st.subheader("⬇️ Download Report")
+    safe_org  = report["organisation_name"].replace(" ", "_")
+    pdf_name  = f"AI_Readiness_{safe_org}.pdf"
+    json_name = f"AI_Readiness_{safe_org}.json"
     dl1, dl2, _ = st.columns([1, 1, 2])
 
     with dl1:
-        if st.button("📄 Download PDF Report", type="primary", use_container_width=True):
+        pdf_bytes = prefetched_pdf()
+        if pdf_bytes:
+            st.download_button(
+                "📄 Download PDF Report",
+                data=pdf_bytes,
+                file_name=pdf_name,
+                mime="application/pdf",
+                type="primary",
+                use_container_width=True,
+            )
+        elif st.button("📄 Download PDF Report", type="primary", use_container_width=True):
             try:
-                r = requests.get(
+                r = http().get(
                     f"{API_URL}/v1/assessment/{st.session_state.session_id}/pdf",
-                    headers=HEADERS,
                     timeout=15,
                 )
                 if r.ok:
+                    st.session_state.pdf_bytes = r.content
                     st.download_button(
                         "Save PDF",
                         data=r.content,
-                        file_name=f"AI_Readiness_{report['organisation_name'].replace(' ','_')}.pdf",
+                        file_name=pdf_name,
                         mime="application/pdf",
                     )
                 else:
@@ -423,8 +595,8 @@ def page_results():
     with dl2:
         st.download_button(
             "📋 Download JSON Report",
-            data=json.dumps(report, indent=2),
-            file_name=f"AI_Readiness_{report['organisation_name'].replace(' ','_')}.json",
+            data=report_json_bytes(st.session_state.session_id, report),
+            file_name=json_name,
             mime="application/json",
             use_container_width=True,
         )
@@ -432,7 +604,10 @@ def page_results():
     if st.button("🔄 Start New Assessment", use_container_width=False):
         st.session_state.session_id = None
         st.session_state.report = None
+        st.session_state.pdf_bytes = None
+        st.session_state.pdf_future = None
         st.session_state.polling = False
+        reset_polling()
         st.rerun()
 
 
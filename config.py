@@ -1,6 +1,7 @@
 """
 config.py — Centralised settings for the AI Readiness Advisor.
 """
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from typing import Optional
@@ -9,27 +10,46 @@ from typing import Optional
 class Settings(BaseSettings):
     app_name: str = "AI Readiness & Migration Advisor"
     app_version: str = "1.0.0"
+    debug: bool = False
 
     # LLM
     anthropic_api_key: Optional[str] = None
     model: str = "claude-opus-4-6"
     max_tokens: int = 4096
+    scoring_model: str = "claude-haiku-4-5"    # Per-dimension scoring (short, bounded JSON)
+    scoring_max_tokens: int = 700
+    synthesis_model: str = "claude-opus-4-6"   # Executive summary + roadmap
+    max_concurrency: int = 6         # Max in-flight Claude requests per engine
+    use_batch_api: bool = False      # Score dimensions via Message Batches (half price, slower)
+    llm_cache_enabled: bool = True   # Reuse replies to identical prompts
+    cache_dir: str = "llm_cache"
 
     # Vector store
     chroma_persist_dir: str = "chroma_store"
     collection_name: str = "enterprise_docs"
     chunk_size: int = 1000
-    chunk_overlap: int = 150
+    chunk_overlap: int = 100
     top_k_retrieval: int = 8
+    keyword_only_max_chunks: int = 0   # Sessions with fewer chunks search with BM25 only (0 = off)
+    embedding_model: Optional[str] = None   # e.g. all-MiniLM-L6-v2 (needs sentence-transformers)
+    reranker_model: Optional[str] = None   # e.g. BAAI/bge-reranker-base (needs sentence-transformers)
 
     # Reports
     reports_dir: str = "reports"
+    pdf_parallel_sections: bool = False   # Render report sections in worker processes (large reports)
 
     # API
     api_key: str = "sk-advisor-demo-001"
+    api_url: str = "http://localhost:8000"   # Where the dashboard reaches the API
 
     class Config:
         env_file = ".env"
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Parse .env and validate once per process; later calls are a cache hit."""
+    return Settings()
+
+
+settings = get_settings()
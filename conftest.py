@@ -0,0 +1,28 @@
+"""
+tests/conftest.py
+=================
+Shared pytest fixtures for the AI Readiness Advisor tests.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """
+    One async client and one app lifespan shared by every API test.
+    Background assessments are stubbed out so uploads never reach Claude.
+    """
+    pytest.importorskip("fastapi")
+    import httpx
+    from asgi_lifespan import LifespanManager
+    from api.app import app
+    from assessment.engine import AssessmentEngine
+    with patch.object(AssessmentEngine, "run_full_assessment", AsyncMock(return_value=None)):
+        async with LifespanManager(app) as manager:
+            transport = httpx.ASGITransport(app=manager.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as c:
+                yield c
@@ -6,7 +6,7 @@ Claude-powered AI Readiness Assessment Engine.
 For each of the 6 dimensions, the engine:
 1. Retrieves the most relevant document chunks via RAG
 2. Prompts Claude with the evidence + scoring rubric
-3. Parses a structured JSON score with strengths, gaps, and recommendations
+3. Collects a structured score (via forced tool use) with strengths, gaps, and recommendations
 
 Then synthesises everything into:
 - Overall score & maturity level
@@ -15,29 +15,68 @@ Then synthesises everything into:
 - Critical blockers and quick wins
 """
 
-import json
+import re
 import uuid
+import asyncio
 import logging
-from anthropic import Anthropic
+from datetime import datetime, timezone
+from functools import lru_cache
+import orjson
+from anthropic import AsyncAnthropic
 
 from config import settings
+from assessment import llm_cache
 from models import (
-    Dimension, DIMENSION_DESCRIPTIONS, DimensionScore, UseCaseCandidate,
+    Dimension, DimensionScore, UseCaseCandidate, get_dimension_description,
     RoadmapPhase, AssessmentReport, get_maturity,
 )
-from ingestion.pipeline import search_documents, ExtractedDocument
+from ingestion.pipeline import (
+    search_documents, batch_search_documents, keyword_search_documents,
+    reciprocal_rank_fusion, ExtractedDocument,
+)
 
 logger = logging.getLogger(__name__)
 
+# Targeted retrieval query per dimension, plus the broad one used for use cases
+DIMENSION_QUERIES = {
+    Dimension.DATA_READINESS:      "data quality data governance data pipeline data lake warehouse",
+    Dimension.TECHNOLOGY_INFRA:    "cloud infrastructure API microservices DevOps MLOps platform",
+    Dimension.TALENT_SKILLS:       "data scientist engineer AI skills training team capabilities",
+    Dimension.PROCESS_AUTOMATION:  "automation workflow process efficiency RPA digital transformation",
+    Dimension.GOVERNANCE_RISK:     "risk compliance policy governance regulation ethics AI policy",
+    Dimension.STRATEGY_LEADERSHIP: "strategy leadership vision budget executive roadmap priority",
+}
+USE_CASE_QUERY = "business process operations workflow department"
+
+# Hybrid retrieval: candidates pulled from each of semantic + BM25 search,
+# and the number of fused chunks that make it into a dimension prompt
+RETRIEVAL_CANDIDATES = 10
+EVIDENCE_CHUNKS = 4
+
+# Long generations report liveness to progress_callback every N text deltas
+HEARTBEAT_DELTAS = 40
+
+# {placeholder} in a prompt template ({{ and }} are literal braces)
+_PLACEHOLDER_RE = re.compile(r"(?<!\{)\{(\w+)\}(?!\})")
+
+# Message Batches status polling backoff (seconds)
+BATCH_POLL_MIN = 1.0
+BATCH_POLL_MAX = 60.0
+
 
 # ---------------------------------------------------------------------------
 # Prompts
 # ---------------------------------------------------------------------------
 
-DIMENSION_PROMPT = """You are a senior AI Strategy Consultant performing an AI Readiness Assessment.
+# Each prompt is a (system, user) pair. The system half is static across calls;
+# only the user half carries per-call evidence and scores. The static halves
+# (with the tool schemas) are well under the models' minimum cacheable prompt
+# length, so they are not marked for prompt caching.
 
-You are evaluating the dimension: **{dimension}**
-Definition: {description}
+DIMENSION_SYSTEM = """You are a senior AI Strategy Consultant performing an AI Readiness Assessment.
+
+The assessment covers these dimensions:
+{dimension_definitions}
 
 SCORING RUBRIC (score out of 10):
 - 0–2 (Nascent): No meaningful capability. Major foundational gaps.
@@ -46,37 +85,36 @@ SCORING RUBRIC (score out of 10):
 - 7–8 (Advanced): Strong capability. Minor gaps. Some best practices in place.
 - 9–10 (Leading): Industry-leading. Systematic. Continuously improving.
 
-EVIDENCE FROM ENTERPRISE DOCUMENTS:
-{evidence}
-
-ADDITIONAL CONTEXT:
-{context}
-
-Assess this dimension based ONLY on the evidence provided. Do not invent information.
+You will be asked to assess one dimension at a time.
+Assess it based ONLY on the evidence provided. Do not invent information.
 If evidence is sparse, score conservatively and note the gap.
 
-Respond with ONLY valid JSON:
+Submit your assessment with the submit_dimension_score tool:
 {{
   "score": <float 0-10>,
   "key_strengths": [<up to 3 specific strengths evidenced in the docs>],
   "key_gaps": [<up to 4 specific gaps or missing capabilities>],
   "evidence_excerpts": [<1-2 direct quotes or paraphrases from the evidence>],
   "recommendations": [<3-4 specific, actionable recommendations>]
-}}"""
+}}""".format(
+    dimension_definitions="\n".join(
+        f"- {d.value}: {get_dimension_description(d)}" for d in Dimension
+    ),
+)
 
+DIMENSION_PROMPT = """You are evaluating the dimension: **{dimension}**
+Definition: {description}
 
-USE_CASE_PROMPT = """You are an AI Solutions Architect identifying AI use case candidates for an enterprise.
+EVIDENCE FROM ENTERPRISE DOCUMENTS:
+{evidence}
 
-ENTERPRISE CONTEXT (from their documents):
-{context}
+ADDITIONAL CONTEXT:
+{context}"""
 
-DIMENSION SCORES SUMMARY:
-{scores_summary}
 
-ADDITIONAL CONTEXT:
-{additional_context}
+USE_CASE_SYSTEM = """You are an AI Solutions Architect identifying AI use case candidates for an enterprise.
 
-Identify the TOP 5 most valuable AI use cases for this enterprise based on:
+Identify the TOP 5 most valuable AI use cases for the enterprise described in the request based on:
 1. Evidence that the process exists and is significant
 2. Feasibility given their current maturity scores
 3. Expected ROI and business impact
@@ -85,8 +123,8 @@ Identify the TOP 5 most valuable AI use cases for this enterprise based on:
 For each use case, specify an AI approach from: RAG, Fine-tuned classifier, 
 Agentic workflow, Predictive model, Generative AI, Computer vision, NLP pipeline.
 
-Respond with ONLY valid JSON — an array of 5 objects:
-[{{
+Submit them with the submit_use_cases tool — "use_cases" is an array of 5 objects:
+[{
   "title": <concise use case name>,
   "description": <2-sentence description>,
   "business_process": <which business process this automates/augments>,
@@ -95,47 +133,51 @@ Respond with ONLY valid JSON — an array of 5 objects:
   "estimated_roi_impact": "Low" | "Medium" | "High",
   "prerequisites": [<2-3 things needed before implementation>],
   "priority_rank": <1-5, 1 = highest>
-}}]"""
-
+}]"""
 
-ROADMAP_PROMPT = """You are an AI Transformation Consultant creating a phased adoption roadmap.
-
-ORGANISATION: {org_name}
-OVERALL AI READINESS SCORE: {overall_score}/10 ({maturity})
+USE_CASE_PROMPT = """ENTERPRISE CONTEXT (from their documents):
+{context}
 
-DIMENSION SCORES:
+DIMENSION SCORES SUMMARY:
 {scores_summary}
 
-TOP USE CASES IDENTIFIED:
-{use_cases_summary}
+ADDITIONAL CONTEXT:
+{additional_context}"""
 
-CRITICAL BLOCKERS:
-{blockers}
 
-Create a realistic 3-phase roadmap. Phase durations should reflect the organisation's 
-maturity — a Nascent org needs longer foundation phases than an Advanced one.
+ROADMAP_SYSTEM = """You are an AI Transformation Consultant creating a phased adoption roadmap.
 
-Respond with ONLY valid JSON — an array of 3 phase objects:
-[{{
+Create a realistic 3-phase roadmap for the organisation described in the request. Phase durations
+should reflect the organisation's maturity — a Nascent org needs longer foundation phases than an
+Advanced one.
+
+Submit it with the submit_roadmap tool — "phases" is an array of 3 objects:
+[{
   "phase": <1, 2, or 3>,
   "title": <evocative phase name>,
   "timeline": <e.g. "Months 1–3" or "Months 4–9">,
   "focus_areas": [<2-3 strategic focus areas>],
   "key_initiatives": [<4-5 specific initiatives to execute>],
-  "success_metrics": [<3-4 measurable KPIs for this phase>,
+  "success_metrics": [<3-4 measurable KPIs for this phase>],
   "dependencies": [<what must be true before this phase begins>]
-}}]"""
-
-
-SYNTHESIS_PROMPT = """You are a Chief AI Officer writing the executive summary for an AI Readiness Assessment.
+}]"""
 
-ORGANISATION: {org_name}
-OVERALL SCORE: {overall_score}/10 — {maturity} maturity
+ROADMAP_PROMPT = """ORGANISATION: {org_name}
+OVERALL AI READINESS SCORE: {overall_score}/10 ({maturity})
 
 DIMENSION SCORES:
 {scores_summary}
 
-Write a concise executive summary (4-5 sentences) that:
+TOP USE CASES IDENTIFIED:
+{use_cases_summary}
+
+CRITICAL BLOCKERS:
+{blockers}"""
+
+
+SYNTHESIS_SYSTEM = """You are a Chief AI Officer writing the executive summary for an AI Readiness Assessment.
+
+For the organisation and scores in the request, write a concise executive summary (4-5 sentences) that:
 1. States the overall readiness level and what it means for AI adoption
 2. Highlights the 2 strongest dimensions
 3. Calls out the 2 most critical gaps
@@ -145,12 +187,143 @@ Then provide:
 - CRITICAL_BLOCKERS: 3-5 things that will prevent AI adoption if not addressed
 - QUICK_WINS: 3-5 things that can be done in <90 days with high impact
 
-Respond with ONLY valid JSON:
-{{
+Submit them with the submit_synthesis tool:
+{
   "executive_summary": <4-5 sentence summary>,
   "critical_blockers": [<blocker strings>],
   "quick_wins": [<quick win strings>]
-}}"""
+}"""
+
+SYNTHESIS_PROMPT = """ORGANISATION: {org_name}
+OVERALL SCORE: {overall_score}/10 — {maturity} maturity
+
+DIMENSION SCORES:
+{scores_summary}"""
+
+
+def _compile_prompt(template: str):
+    """
+    Split a prompt template into its static text and placeholder names once,
+    returning a renderer that just joins the pieces around the values.
+    """
+    pieces = _PLACEHOLDER_RE.split(template)
+    literals = [p.replace("{{", "{").replace("}}", "}") for p in pieces[0::2]]
+    names = pieces[1::2]
+
+    def render(**values) -> str:
+        parts = [literals[0]]
+        for name, literal in zip(names, literals[1:]):
+            parts.append(str(values[name]))
+            parts.append(literal)
+        return "".join(parts)
+
+    return render
+
+
+render_dimension_prompt = _compile_prompt(DIMENSION_PROMPT)
+render_use_case_prompt = _compile_prompt(USE_CASE_PROMPT)
+render_roadmap_prompt = _compile_prompt(ROADMAP_PROMPT)
+render_synthesis_prompt = _compile_prompt(SYNTHESIS_PROMPT)
+
+
+# ---------------------------------------------------------------------------
+# Tools
+# ---------------------------------------------------------------------------
+
+# Each call forces Claude to answer through one of these tools, so replies
+# arrive as schema-shaped dicts rather than free text that needs parsing.
+
+def _tool(name: str, description: str, properties: dict) -> dict:
+    return {
+        "name": name,
+        "description": description,
+        "input_schema": {
+            "type": "object",
+            "properties": properties,
+            "required": list(properties),
+        },
+    }
+
+
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+DIMENSION_TOOL = _tool(
+    "submit_dimension_score",
+    "Submit the score and findings for the dimension being assessed.",
+    {
+        "score": {"type": "number", "minimum": 0, "maximum": 10},
+        "key_strengths": _STRING_LIST,
+        "key_gaps": _STRING_LIST,
+        "evidence_excerpts": _STRING_LIST,
+        "recommendations": _STRING_LIST,
+    },
+)
+
+USE_CASE_TOOL = _tool(
+    "submit_use_cases",
+    "Submit the top 5 AI use case candidates.",
+    {"use_cases": {"type": "array", "items": UseCaseCandidate.model_json_schema()}},
+)
+
+ROADMAP_TOOL = _tool(
+    "submit_roadmap",
+    "Submit the 3-phase adoption roadmap.",
+    {"phases": {"type": "array", "items": RoadmapPhase.model_json_schema()}},
+)
+
+SYNTHESIS_TOOL = _tool(
+    "submit_synthesis",
+    "Submit the executive summary, critical blockers and quick wins.",
+    {
+        "executive_summary": {"type": "string"},
+        "critical_blockers": _STRING_LIST,
+        "quick_wins": _STRING_LIST,
+    },
+)
+
+
+# Use cases, synthesis and roadmap in one turn — Claude calls all three tools
+# in order, so the roadmap can build on the use cases and blockers it just wrote
+FUSED_SYSTEM = (
+    "You are a senior AI advisory team completing an AI Readiness Assessment. "
+    "Complete the three tasks below in order, calling each tool exactly once in a "
+    "single reply: submit_use_cases, then submit_synthesis, then submit_roadmap. "
+    "The roadmap must address the use cases and critical blockers you identify.\n\n"
+    "## TASK 1 — USE CASES\n" + USE_CASE_SYSTEM + "\n\n"
+    "## TASK 2 — EXECUTIVE SUMMARY\n" + SYNTHESIS_SYSTEM + "\n\n"
+    "## TASK 3 — ROADMAP\n" + ROADMAP_SYSTEM
+)
+
+FUSED_PROMPT = """ORGANISATION: {org_name}
+OVERALL AI READINESS SCORE: {overall_score}/10 ({maturity})
+
+ENTERPRISE CONTEXT (from their documents):
+{context}
+
+DIMENSION SCORES:
+{scores_summary}
+
+ADDITIONAL CONTEXT:
+{additional_context}"""
+
+render_fused_prompt = _compile_prompt(FUSED_PROMPT)
+
+
+def scores_summary_short(dimension_scores: list[DimensionScore]) -> str:
+    """One line per dimension: score and maturity."""
+    return "\n".join(
+        f"- {s.dimension.value}: {s.score}/10 ({s.maturity_level})"
+        for s in dimension_scores
+    )
+
+
+def scores_summary_rich(dimension_scores: list[DimensionScore]) -> str:
+    """One line per dimension: score plus the top strengths and gaps."""
+    return "\n".join(
+        f"- {s.dimension.value}: {s.score}/10 — Strengths: {', '.join(s.key_strengths[:2])}. "
+        f"Gaps: {', '.join(s.key_gaps[:2])}."
+        for s in dimension_scores
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -160,76 +333,155 @@ Respond with ONLY valid JSON:
 class AssessmentEngine:
 
     def __init__(self):
-        self.client = Anthropic(api_key=settings.anthropic_api_key)
+        self.client = AsyncAnthropic(api_key=settings.anthropic_api_key)
+        # Caps in-flight Claude requests so concurrent dimensions respect rate limits
+        self._semaphore = asyncio.Semaphore(settings.max_concurrency)
+        self._reranker = None
+        if settings.reranker_model:
+            # Optional dependency — only needed when a reranker is configured
+            from sentence_transformers import CrossEncoder
+            self._reranker = CrossEncoder(settings.reranker_model)
+
+    def _rerank(self, query: str, results: list[dict]) -> list[dict]:
+        """Order candidates by cross-encoder relevance to the query."""
+        scores = self._reranker.predict([(query, r["content"]) for r in results], batch_size=32)
+        order = sorted(range(len(results)), key=lambda i: scores[i], reverse=True)
+        return [results[i] for i in order]
+
+    def _message_params(
+        self, system: str, prompt: str, tools: list[dict], model: str, max_tokens: int
+    ) -> dict:
+        """Request body shared by messages.stream and Message Batches entries."""
+        return {
+            "model": model,
+            "max_tokens": max_tokens,
+            "system": system,
+            "tools": tools,
+            # Force the single tool, or require at least one of several
+            "tool_choice": (
+                {"type": "tool", "name": tools[0]["name"]} if len(tools) == 1 else {"type": "any"}
+            ),
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    def _tool_input(self, message, tool: dict) -> dict:
+        """Pull the forced tool call's arguments out of a Claude message."""
+        for block in message.content:
+            if block.type == "tool_use" and block.name == tool["name"]:
+                return block.input
+        raise ValueError(f"Claude did not call {tool['name']} (stop_reason={message.stop_reason})")
 
-    def _call_claude(self, prompt: str) -> str:
-        response = self.client.messages.create(
-            model=settings.model,
-            max_tokens=settings.max_tokens,
-            messages=[{"role": "user", "content": prompt}],
+    async def _call_claude_tools(
+        self,
+        system: str,
+        prompt: str,
+        tools: list[dict],
+        model: str,
+        max_tokens: int,
+        heartbeat=None,
+    ) -> dict[str, dict]:
+        """Returns {tool name: input} for every offered tool Claude called."""
+        names = [t["name"] for t in tools]
+        key = None
+        if settings.llm_cache_enabled:
+            key = llm_cache.make_key(model, str(max_tokens), *names, system, prompt)
+            cached = llm_cache.get(key)
+            if cached is not None:
+                return orjson.loads(cached)
+
+        # Stream so long replies can signal liveness while they generate
+        async with self._semaphore:
+            async with self.client.messages.stream(
+                **self._message_params(system, prompt, tools, model, max_tokens)
+            ) as stream:
+                events = 0
+                async for _ in stream:
+                    events += 1
+                    if heartbeat and events % HEARTBEAT_DELTAS == 0:
+                        heartbeat()
+                message = await stream.get_final_message()
+        blocks = [b for b in message.content if b.type == "tool_use" and b.name in names]
+        if message.stop_reason == "max_tokens" and blocks:
+            # The last call was cut off mid-arguments — don't trust it
+            blocks.pop()
+        calls = {block.name: block.input for block in blocks}
+
+        # Only a complete reply is worth replaying
+        if key is not None and len(calls) == len(names):
+            llm_cache.set(key, orjson.dumps(calls))
+        return calls
+
+    async def _call_claude(
+        self,
+        system: str,
+        prompt: str,
+        tool: dict,
+        model: str,
+        max_tokens: int,
+        heartbeat=None,
+    ) -> dict:
+        calls = await self._call_claude_tools(system, prompt, [tool], model, max_tokens, heartbeat)
+        if tool["name"] not in calls:
+            raise ValueError(f"Claude did not call {tool['name']}")
+        return calls[tool["name"]]
+
+    async def _retrieve_evidence(
+        self, query: str, session_id: str, results: list[dict] | None = None
+    ) -> str | None:
+        """
+        Retrieve relevant document chunks for a query (semantic results may be
+        passed in pre-fetched), fused with BM25 keyword hits via RRF and, if a
+        reranker is configured, reordered by the cross-encoder.
+        Returns None when nothing relevant was found.
+        """
+        # ChromaDB and BM25 are synchronous — keep them off the event loop
+        if results is None:
+            results = await asyncio.to_thread(search_documents, query, session_id, RETRIEVAL_CANDIDATES)
+        keyword_results = await asyncio.to_thread(
+            keyword_search_documents, query, session_id, RETRIEVAL_CANDIDATES
+        )
+        fused = reciprocal_rank_fusion([results, keyword_results])
+        if self._reranker and len(fused) > EVIDENCE_CHUNKS:
+            fused = await asyncio.to_thread(self._rerank, query, fused)
+        if not fused:
+            return None
+        return "\n\n---\n\n".join(
+            f"[Source: {r['source']}]\n{r['display_text']}" for r in fused[:EVIDENCE_CHUNKS]
         )
-        return response.content[0].text
-
-    def _parse_json(self, text: str) -> dict | list:
-        """Extract and parse JSON from Claude's response."""
-        text = text.strip()
-        # Strip markdown fences if present
-        if text.startswith("```"):
-            text = "\n".join(text.split("\n")[1:])
-        if text.endswith("```"):
-            text = "\n".join(text.split("\n")[:-1])
-        return json.loads(text.strip())
-
-    def _retrieve_evidence(self, query: str, session_id: str) -> str:
-        """Retrieve relevant document chunks for a query."""
-        results = search_documents(query, session_id)
-        if not results:
-            return "No specific evidence found for this dimension."
-        chunks = []
-        for r in results[:6]:
-            chunks.append(f"[Source: {r['source']}]\n{r['content'][:600]}")
-        return "\n\n---\n\n".join(chunks)
 
     # ------------------------------------------------------------------
     # Step 1: Score each dimension
     # ------------------------------------------------------------------
 
-    def assess_dimension(
+    async def _dimension_prompt(
         self,
         dimension: Dimension,
         session_id: str,
         additional_context: str = "",
-    ) -> DimensionScore:
-        logger.info(f"Assessing dimension: {dimension.value}")
-
-        # Build a targeted query for this dimension
-        query_map = {
-            Dimension.DATA_READINESS:      "data quality data governance data pipeline data lake warehouse",
-            Dimension.TECHNOLOGY_INFRA:    "cloud infrastructure API microservices DevOps MLOps platform",
-            Dimension.TALENT_SKILLS:       "data scientist engineer AI skills training team capabilities",
-            Dimension.PROCESS_AUTOMATION:  "automation workflow process efficiency RPA digital transformation",
-            Dimension.GOVERNANCE_RISK:     "risk compliance policy governance regulation ethics AI policy",
-            Dimension.STRATEGY_LEADERSHIP: "strategy leadership vision budget executive roadmap priority",
-        }
-        query = query_map.get(dimension, dimension.value)
-        evidence = self._retrieve_evidence(query, session_id)
-
-        prompt = DIMENSION_PROMPT.format(
+        results: list[dict] | None = None,
+    ) -> str | None:
+        """Returns None when there is neither evidence nor context to assess."""
+        query = DIMENSION_QUERIES.get(dimension, dimension.value)
+        evidence = await self._retrieve_evidence(query, session_id, results)
+        if evidence is None and not additional_context:
+            return None
+
+        return render_dimension_prompt(
             dimension=dimension.value,
-            description=DIMENSION_DESCRIPTIONS[dimension],
-            evidence=evidence,
+            description=get_dimension_description(dimension),
+            evidence=evidence or "No specific evidence found for this dimension.",
             context=additional_context or "No additional context provided.",
         )
 
-        raw = self._call_claude(prompt)
-        parsed = self._parse_json(raw)
-
-        score = float(parsed["score"])
+    def _dimension_score(self, dimension: Dimension, parsed: dict) -> DimensionScore:
+        # Band the score Claude reported at the precision we store, so the label
+        # always agrees with the number (and lookups hit get_maturity's cache)
+        score = round(float(parsed["score"]), 1)
         maturity, color, _ = get_maturity(score)
 
         return DimensionScore(
             dimension=dimension,
-            score=round(score, 1),
+            score=score,
             maturity_level=maturity,
             maturity_color=color,
             key_strengths=parsed.get("key_strengths", []),
@@ -238,38 +490,122 @@ class AssessmentEngine:
             recommendations=parsed.get("recommendations", []),
         )
 
+    def _unevidenced_score(self, dimension: Dimension) -> DimensionScore:
+        """Conservative score for a dimension the documents say nothing about."""
+        maturity, color, _ = get_maturity(0.0)
+        return DimensionScore(
+            dimension=dimension,
+            score=0.0,
+            maturity_level=maturity,
+            maturity_color=color,
+            key_gaps=[f"No evidence of {dimension.value.lower()} found in the documents provided"],
+            recommendations=[f"Provide documentation covering {dimension.value.lower()}"],
+        )
+
+    async def assess_dimension(
+        self,
+        dimension: Dimension,
+        session_id: str,
+        additional_context: str = "",
+        results: list[dict] | None = None,
+    ) -> DimensionScore:
+        logger.info(f"Assessing dimension: {dimension.value}")
+        prompt = await self._dimension_prompt(dimension, session_id, additional_context, results)
+        if prompt is None:
+            return self._unevidenced_score(dimension)
+        parsed = await self._call_claude(
+            DIMENSION_SYSTEM, prompt, DIMENSION_TOOL, settings.scoring_model, settings.scoring_max_tokens
+        )
+        return self._dimension_score(dimension, parsed)
+
+    async def assess_dimensions_batch(
+        self,
+        dimensions: list[Dimension],
+        session_id: str,
+        additional_context: str = "",
+        retrieved: dict[str, list[dict]] | None = None,
+    ) -> list[DimensionScore]:
+        """
+        Scores every dimension in a single Message Batches submission.
+        Batched requests are billed at half price and draw on a separate rate
+        limit, at the cost of latency — only suitable for background runs.
+        """
+        logger.info(f"Submitting batch of {len(dimensions)} dimension assessments")
+
+        prompts = await asyncio.gather(*(
+            self._dimension_prompt(
+                dim, session_id, additional_context,
+                retrieved.get(DIMENSION_QUERIES.get(dim)) if retrieved else None,
+            )
+            for dim in dimensions
+        ))
+        to_score = [(dim, prompt) for dim, prompt in zip(dimensions, prompts) if prompt is not None]
+        if not to_score:
+            return [self._unevidenced_score(dim) for dim in dimensions]
+
+        batch = await self.client.messages.batches.create(requests=[
+            {
+                "custom_id": f"dim-{dim.name}",
+                "params": self._message_params(
+                    DIMENSION_SYSTEM, prompt, [DIMENSION_TOOL],
+                    settings.scoring_model, settings.scoring_max_tokens,
+                ),
+            }
+            for dim, prompt in to_score
+        ])
+
+        # Poll with exponential backoff until every request has been processed
+        delay = BATCH_POLL_MIN
+        while batch.processing_status != "ended":
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, BATCH_POLL_MAX)
+            batch = await self.client.messages.batches.retrieve(batch.id)
+
+        # Results arrive in completion order — map them back via custom_id
+        parsed_by_id = {}
+        async for entry in await self.client.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                raise ValueError(f"Batch request {entry.custom_id} {entry.result.type}")
+            parsed_by_id[entry.custom_id] = self._tool_input(entry.result.message, DIMENSION_TOOL)
+
+        return [
+            self._dimension_score(dim, parsed_by_id[f"dim-{dim.name}"])
+            if f"dim-{dim.name}" in parsed_by_id else self._unevidenced_score(dim)
+            for dim in dimensions
+        ]
+
     # ------------------------------------------------------------------
     # Step 2: Identify use cases
     # ------------------------------------------------------------------
 
-    def identify_use_cases(
+    async def identify_use_cases(
         self,
-        dimension_scores: list[DimensionScore],
+        scores_summary: str,
         session_id: str,
         additional_context: str = "",
+        context_chunks: list[dict] | None = None,
     ) -> list[UseCaseCandidate]:
         logger.info("Identifying use case candidates...")
 
         # Retrieve broad context about business processes
-        context_chunks = search_documents("business process operations workflow department", session_id)
+        if context_chunks is None:
+            context_chunks = await asyncio.to_thread(search_documents, USE_CASE_QUERY, session_id)
         context = "\n\n".join(r["content"][:500] for r in context_chunks[:5])
 
-        scores_summary = "\n".join(
-            f"- {s.dimension.value}: {s.score}/10 ({s.maturity_level})"
-            for s in dimension_scores
-        )
-
-        prompt = USE_CASE_PROMPT.format(
+        prompt = render_use_case_prompt(
             context=context or "Limited process documentation available.",
             scores_summary=scores_summary,
             additional_context=additional_context or "General enterprise context.",
         )
 
-        raw = self._call_claude(prompt)
-        parsed = self._parse_json(raw)
+        parsed = await self._call_claude(
+            USE_CASE_SYSTEM, prompt, USE_CASE_TOOL, settings.model, settings.max_tokens
+        )
+        return self._use_cases(parsed)
 
+    def _use_cases(self, parsed: dict) -> list[UseCaseCandidate]:
         use_cases = []
-        for i, uc in enumerate(parsed[:5]):
+        for i, uc in enumerate(parsed["use_cases"][:5]):
             use_cases.append(UseCaseCandidate(
                 title=uc["title"],
                 description=uc["description"],
@@ -287,57 +623,51 @@ class AssessmentEngine:
     # Step 3: Synthesise executive summary + blockers
     # ------------------------------------------------------------------
 
-    def synthesise(
+    async def synthesise(
         self,
         org_name: str,
         overall_score: float,
         overall_maturity: str,
-        dimension_scores: list[DimensionScore],
+        scores_summary: str,
+        heartbeat=None,
     ) -> dict:
         logger.info("Synthesising executive summary...")
 
-        scores_summary = "\n".join(
-            f"- {s.dimension.value}: {s.score}/10 — Strengths: {', '.join(s.key_strengths[:2])}. "
-            f"Gaps: {', '.join(s.key_gaps[:2])}."
-            for s in dimension_scores
-        )
-
-        prompt = SYNTHESIS_PROMPT.format(
+        prompt = render_synthesis_prompt(
             org_name=org_name,
             overall_score=overall_score,
             maturity=overall_maturity,
             scores_summary=scores_summary,
         )
 
-        raw = self._call_claude(prompt)
-        return self._parse_json(raw)
+        return await self._call_claude(
+            SYNTHESIS_SYSTEM, prompt, SYNTHESIS_TOOL,
+            settings.synthesis_model, settings.max_tokens, heartbeat,
+        )
 
     # ------------------------------------------------------------------
     # Step 4: Build roadmap
     # ------------------------------------------------------------------
 
-    def build_roadmap(
+    async def build_roadmap(
         self,
         org_name: str,
         overall_score: float,
         overall_maturity: str,
-        dimension_scores: list[DimensionScore],
+        scores_summary: str,
         use_cases: list[UseCaseCandidate],
         critical_blockers: list[str],
+        heartbeat=None,
     ) -> list[RoadmapPhase]:
         logger.info("Building adoption roadmap...")
 
-        scores_summary = "\n".join(
-            f"- {s.dimension.value}: {s.score}/10 ({s.maturity_level})"
-            for s in dimension_scores
-        )
         use_cases_summary = "\n".join(
             f"- [{uc.priority_rank}] {uc.title} ({uc.estimated_complexity} complexity, {uc.estimated_roi_impact} ROI)"
             for uc in use_cases
         )
         blockers = "\n".join(f"- {b}" for b in critical_blockers)
 
-        prompt = ROADMAP_PROMPT.format(
+        prompt = render_roadmap_prompt(
             org_name=org_name,
             overall_score=overall_score,
             maturity=overall_maturity,
@@ -346,9 +676,13 @@ class AssessmentEngine:
             blockers=blockers,
         )
 
-        raw = self._call_claude(prompt)
-        parsed = self._parse_json(raw)
+        parsed = await self._call_claude(
+            ROADMAP_SYSTEM, prompt, ROADMAP_TOOL,
+            settings.synthesis_model, settings.max_tokens, heartbeat,
+        )
+        return self._roadmap(parsed)
 
+    def _roadmap(self, parsed: dict) -> list[RoadmapPhase]:
         return [
             RoadmapPhase(
                 phase=p["phase"],
@@ -359,14 +693,72 @@ class AssessmentEngine:
                 success_metrics=p.get("success_metrics", []),
                 dependencies=p.get("dependencies", []),
             )
-            for p in parsed
+            for p in parsed["phases"]
         ]
 
+    # ------------------------------------------------------------------
+    # Steps 2–4 fused: use cases, synthesis and roadmap in one Claude turn
+    # ------------------------------------------------------------------
+
+    async def plan_adoption(
+        self,
+        org_name: str,
+        overall_score: float,
+        overall_maturity: str,
+        scores_summary: str,
+        context_chunks: list[dict],
+        additional_context: str = "",
+        heartbeat=None,
+    ) -> dict[str, dict]:
+        """
+        Offers the use case, synthesis and roadmap tools together so all three
+        come back in one round trip. Returns {tool name: input} for the tools
+        Claude actually called — callers fall back to the per-step methods
+        for anything missing.
+        """
+        logger.info("Planning use cases, synthesis and roadmap in one turn...")
+
+        context = "\n\n".join(r["content"][:500] for r in context_chunks[:5])
+
+        prompt = render_fused_prompt(
+            org_name=org_name,
+            overall_score=overall_score,
+            maturity=overall_maturity,
+            context=context or "Limited process documentation available.",
+            scores_summary=scores_summary,
+            additional_context=additional_context or "General enterprise context.",
+        )
+
+        return await self._call_claude_tools(
+            FUSED_SYSTEM, prompt, [USE_CASE_TOOL, SYNTHESIS_TOOL, ROADMAP_TOOL],
+            settings.synthesis_model, settings.max_tokens, heartbeat,
+        )
+
     # ------------------------------------------------------------------
     # Full assessment orchestrator
     # ------------------------------------------------------------------
 
-    def run_full_assessment(
+    def _empty_report(self, report_id: str, org_name: str) -> AssessmentReport:
+        """Report for a session with no ingested documents, built without Claude."""
+        maturity, color, _ = get_maturity(0.0)
+        return AssessmentReport(
+            report_id=report_id,
+            organisation_name=org_name,
+            generated_at=datetime.now(timezone.utc).isoformat(),
+            documents_analysed=[],
+            total_pages_analysed=0,
+            overall_score=0.0,
+            overall_maturity=maturity,
+            overall_maturity_color=color,
+            executive_summary="No documents analysed.",
+            dimension_scores=[self._unevidenced_score(d) for d in Dimension],
+            use_case_candidates=[],
+            roadmap_phases=[],
+            critical_blockers=["No documents were provided for assessment"],
+            quick_wins=[],
+        )
+
+    async def run_full_assessment(
         self,
         session_id: str,
         org_name: str,
@@ -380,44 +772,106 @@ class AssessmentEngine:
         """
         report_id = f"RPT-{uuid.uuid4().hex[:8].upper()}"
 
-        # Step 1: Score all 6 dimensions
-        dimension_scores = []
+        # Nothing was ingested — there is nothing for Claude to assess
+        if not extracted_docs:
+            return self._empty_report(report_id, org_name)
+
+        # Step 1: Score all 6 dimensions concurrently — each is an independent
+        # retrieval + Claude round trip, so their network waits overlap
         dimensions = list(Dimension)
-        for i, dim in enumerate(dimensions):
+        completed = 0
+
+        def on_dimension_done(dim: Dimension, task: asyncio.Task) -> None:
+            nonlocal completed
+            completed += 1
+            if progress_callback and not task.cancelled() and task.exception() is None:
+                pct = 45 + int((completed / len(dimensions)) * 35)
+                progress_callback(f"Analysed: {dim.value}", pct)
+
+        if progress_callback:
+            progress_callback("Analysing all dimensions...", 45)
+
+        # Embed and search every retrieval query in a single vector store round trip
+        queries = [DIMENSION_QUERIES[d] for d in dimensions] + [USE_CASE_QUERY]
+        retrieved = await asyncio.to_thread(
+            batch_search_documents, queries, session_id, RETRIEVAL_CANDIDATES
+        )
+
+        if settings.use_batch_api:
+            dimension_scores = await self.assess_dimensions_batch(
+                dimensions, session_id, additional_context, retrieved
+            )
             if progress_callback:
-                pct = 45 + int((i / len(dimensions)) * 35)
-                progress_callback(f"Analysing: {dim.value}...", pct)
-            score = self.assess_dimension(dim, session_id, additional_context)
-            dimension_scores.append(score)
+                progress_callback("Analysed all dimensions", 80)
+        else:
+            tasks = []
+            for dim in dimensions:
+                task = asyncio.create_task(self.assess_dimension(
+                    dim, session_id, additional_context, retrieved[DIMENSION_QUERIES[dim]]
+                ))
+                task.add_done_callback(lambda t, dim=dim: on_dimension_done(dim, t))
+                tasks.append(task)
+            dimension_scores = list(await asyncio.gather(*tasks))
 
         # Overall score = weighted average (equal weights for now)
         overall_score = round(sum(s.score for s in dimension_scores) / len(dimension_scores), 1)
         overall_maturity, overall_color, _ = get_maturity(overall_score)
 
-        if progress_callback:
-            progress_callback("Identifying AI use case candidates...", 82)
+        # Built once so every downstream prompt sees byte-identical summaries
+        summary_short = scores_summary_short(dimension_scores)
+        summary_rich = scores_summary_rich(dimension_scores)
 
-        # Step 2: Use cases
-        use_cases = self.identify_use_cases(dimension_scores, session_id, additional_context)
+        def heartbeat(step: str, pct: int):
+            if progress_callback:
+                return lambda: progress_callback(step, pct)
+            return None
 
         if progress_callback:
-            progress_callback("Synthesising executive summary...", 88)
+            progress_callback("Identifying use cases, synthesising and building roadmap...", 82)
 
-        # Step 3: Synthesis
-        synthesis = self.synthesise(org_name, overall_score, overall_maturity, dimension_scores)
+        # Steps 2–4 in a single turn; any tool Claude skipped is redone on its own below
+        fused = await self.plan_adoption(
+            org_name, overall_score, overall_maturity, summary_rich,
+            retrieved[USE_CASE_QUERY], additional_context,
+            heartbeat=heartbeat("Identifying use cases, synthesising and building roadmap...", 82),
+        )
 
-        if progress_callback:
-            progress_callback("Building adoption roadmap...", 93)
+        # Step 2: Use cases
+        if USE_CASE_TOOL["name"] in fused:
+            use_cases = self._use_cases(fused[USE_CASE_TOOL["name"]])
+        else:
+            if progress_callback:
+                progress_callback("Identifying AI use case candidates...", 85)
+            use_cases = await self.identify_use_cases(
+                summary_short, session_id, additional_context, retrieved[USE_CASE_QUERY]
+            )
+
+        # Step 3: Synthesis
+        if SYNTHESIS_TOOL["name"] in fused:
+            synthesis = fused[SYNTHESIS_TOOL["name"]]
+        else:
+            if progress_callback:
+                progress_callback("Synthesising executive summary...", 88)
+            synthesis = await self.synthesise(
+                org_name, overall_score, overall_maturity, summary_rich,
+                heartbeat=heartbeat("Synthesising executive summary...", 88),
+            )
 
         # Step 4: Roadmap
-        roadmap = self.build_roadmap(
-            org_name=org_name,
-            overall_score=overall_score,
-            overall_maturity=overall_maturity,
-            dimension_scores=dimension_scores,
-            use_cases=use_cases,
-            critical_blockers=synthesis.get("critical_blockers", []),
-        )
+        if ROADMAP_TOOL["name"] in fused:
+            roadmap = self._roadmap(fused[ROADMAP_TOOL["name"]])
+        else:
+            if progress_callback:
+                progress_callback("Building adoption roadmap...", 93)
+            roadmap = await self.build_roadmap(
+                org_name=org_name,
+                overall_score=overall_score,
+                overall_maturity=overall_maturity,
+                scores_summary=summary_short,
+                use_cases=use_cases,
+                critical_blockers=synthesis.get("critical_blockers", []),
+                heartbeat=heartbeat("Building adoption roadmap...", 93),
+            )
 
         if progress_callback:
             progress_callback("Finalising report...", 98)
@@ -425,6 +879,7 @@ class AssessmentEngine:
         return AssessmentReport(
             report_id=report_id,
             organisation_name=org_name,
+            generated_at=datetime.now(timezone.utc).isoformat(),
             documents_analysed=[doc.filename for doc in extracted_docs],
             total_pages_analysed=sum(doc.page_count for doc in extracted_docs),
             overall_score=overall_score,
@@ -437,3 +892,14 @@ class AssessmentEngine:
             critical_blockers=synthesis.get("critical_blockers", []),
             quick_wins=synthesis.get("quick_wins", []),
         )
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> AssessmentEngine:
+    """
+    Shared engine, built on first use. Reusing it keeps the Anthropic client's
+    connection pool (and any reranker model) warm across assessments instead of
+    paying TLS handshakes and model loads per request. Share it within one
+    event loop — the client's pool and the concurrency semaphore bind to it.
+    """
+    return AssessmentEngine()
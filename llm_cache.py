@@ -0,0 +1,40 @@
+"""
+assessment/llm_cache.py
+=======================
+On-disk response cache for Claude calls.
+
+Keys are a SHA-256 of everything that determines the reply (model, token
+budget, system prompt, user prompt), so re-running an assessment over the
+same documents is answered from disk instead of the API.
+"""
+
+import hashlib
+from functools import lru_cache
+
+import diskcache
+
+from config import settings
+
+# Cached replies expire after a week
+CACHE_TTL = 7 * 86400
+
+
+@lru_cache(maxsize=1)
+def _cache() -> diskcache.Cache:
+    return diskcache.Cache(settings.cache_dir)
+
+
+def make_key(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def get(key: str) -> bytes | None:
+    return _cache().get(key)
+
+
+def set(key: str, payload: bytes) -> None:
+    _cache().set(key, payload, expire=CACHE_TTL)
@@ -5,9 +5,11 @@ The assessment evaluates enterprises across 6 dimensions based on
 industry frameworks (McKinsey AI Maturity, Gartner AI Readiness, MIT CISR).
 """
 
+from bisect import bisect_right
+from functools import lru_cache, cached_property
 from pydantic import BaseModel, Field
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 
 
@@ -51,6 +53,12 @@ DIMENSION_DESCRIPTIONS = {
     ),
 }
 
+
+def get_dimension_description(dim: Dimension) -> str:
+    """Description of a dimension, as used in prompts and reports."""
+    return DIMENSION_DESCRIPTIONS[dim]
+
+
 MATURITY_LEVELS = {
     (0.0, 2.0): ("Nascent",     "red",    "AI adoption has not meaningfully begun."),
     (2.0, 4.0): ("Emerging",    "orange", "Early experiments underway; significant gaps remain."),
@@ -60,11 +68,17 @@ MATURITY_LEVELS = {
 }
 
 
+# Band lower bounds above the first (2.0, 4.0, ...); bisecting a score into
+# them indexes the matching (label, colour, description) entry
+_MATURITY_BOUNDS = tuple(low for low, _ in MATURITY_LEVELS)[1:]
+_MATURITY_TABLE = tuple(MATURITY_LEVELS.values())
+
+
+@lru_cache(maxsize=128)
 def get_maturity(score: float) -> tuple[str, str, str]:
-    for (lo, hi), (label, color, description) in MATURITY_LEVELS.items():
-        if lo <= score < hi:
-            return label, color, description
-    return "Nascent", "red", ""
+    if not 0.0 <= score < 10.1:
+        return "Nascent", "red", ""
+    return _MATURITY_TABLE[bisect_right(_MATURITY_BOUNDS, score)]
 
 
 # ---------------------------------------------------------------------------
@@ -119,7 +133,7 @@ class AssessmentReport(BaseModel):
     # Metadata
     report_id: str
     organisation_name: str
-    generated_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    generated_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
     documents_analysed: list[str]
     total_pages_analysed: int
 
@@ -145,6 +159,11 @@ class AssessmentReport(BaseModel):
     # Raw LLM outputs (for traceability)
     analyst_notes: Optional[str] = None
 
+    @cached_property
+    def generated_at_dt(self) -> datetime:
+        """``generated_at`` parsed once per report."""
+        return datetime.fromisoformat(self.generated_at)
+
 
 # ---------------------------------------------------------------------------
 # API Schemas
@@ -12,10 +12,21 @@ Output: A multi-page PDF with:
   - Phased roadmap
 """
 
+import io
 import os
+import re
+import multiprocessing
 from pathlib import Path
-from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
+from types import MappingProxyType
+from xml.sax.saxutils import escape
+from typing import BinaryIO
+from concurrent.futures import ProcessPoolExecutor
 
+from pypdf import PdfWriter
+
+from reportlab import rl_config
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import cm
@@ -29,6 +40,12 @@ from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 from models import AssessmentReport, Dimension
 from config import settings
 
+# Attribute validation on graphics shapes is a debugging aid; skip it in
+# normal runs. Set once here rather than toggled per build, since the flag is
+# process-global and reports may be built concurrently.
+if not settings.debug:
+    rl_config.shapeChecking = 0
+
 
 # ---------------------------------------------------------------------------
 # Colour palette
@@ -52,13 +69,25 @@ MATURITY_COLORS = {
 
 SCORE_BAR_BG = colors.HexColor("#e2e8f0")
 
+PHASE_COLORS = [BRAND_BLUE, BRAND_GREEN, colors.HexColor("#8b5cf6")]
+
+# Table layout cost grows faster than row count; long tables are split into
+# chunks of this many body rows, each repeating the header
+TABLE_CHUNK_ROWS = 40
+
 
 # ---------------------------------------------------------------------------
 # Styles
 # ---------------------------------------------------------------------------
 
+# Built once per process — getSampleStyleSheet() constructs every style afresh
+_BASE_STYLES = getSampleStyleSheet()
+
+
+@lru_cache(maxsize=1)
 def build_styles():
-    base = getSampleStyleSheet()
+    """Report paragraph styles, shared read-only across reports."""
+    base = _BASE_STYLES
     styles = {
         "title": ParagraphStyle("title", parent=base["Title"],
             fontSize=28, textColor=BRAND_DARK, spaceAfter=8, leading=34),
@@ -82,42 +111,60 @@ def build_styles():
         "center": ParagraphStyle("center", parent=base["Normal"],
             fontSize=10, alignment=TA_CENTER, textColor=BRAND_DARK),
     }
-    return styles
+    # Colour variants are fixed too, so build them here rather than per row
+    for name, color in MATURITY_COLORS.items():
+        styles[f"mat_{name}"] = ParagraphStyle(f"mat_{name}",
+            fontSize=20, textColor=color, alignment=TA_CENTER, leading=24)
+    for i, color in enumerate(PHASE_COLORS):
+        styles[f"phase_{i}"] = ParagraphStyle(f"phase_{i}",
+            fontSize=12, textColor=color, spaceBefore=8, spaceAfter=4)
+    return MappingProxyType(styles)
 
 
 # ---------------------------------------------------------------------------
 # Helper builders
 # ---------------------------------------------------------------------------
 
-def score_bar_table(score: float, color: str, width: float = 10 * cm):
-    """Renders a visual score bar as a table."""
-    filled = score / 10.0
-    bar_color = MATURITY_COLORS.get(color, BRAND_BLUE)
-    data = [[""]]
-    t = Table(data, colWidths=[width * filled], rowHeights=[10])
-    t.setStyle(TableStyle([
+def _score_bar_styles(bar_color) -> tuple[TableStyle, TableStyle]:
+    inner = TableStyle([
         ("BACKGROUND", (0, 0), (-1, -1), bar_color),
         ("LINEABOVE", (0, 0), (-1, -1), 0, colors.white),
-    ]))
-    # Wrap in outer table with grey background
-    outer = Table([[t, ""]], colWidths=[width * filled, width * (1 - filled)], rowHeights=[10])
-    outer.setStyle(TableStyle([
+    ])
+    outer = TableStyle([
         ("BACKGROUND", (0, 0), (0, 0), bar_color),
         ("BACKGROUND", (1, 0), (1, 0), SCORE_BAR_BG),
         ("LEFTPADDING", (0, 0), (-1, -1), 0),
         ("RIGHTPADDING", (0, 0), (-1, -1), 0),
         ("TOPPADDING", (0, 0), (-1, -1), 0),
         ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-    ]))
+    ])
+    return inner, outer
+
+
+# Only the widths vary per bar, so the (inner, outer) styles are built once
+# per maturity colour and shared
+SCORE_BAR_STYLES = {name: _score_bar_styles(color) for name, color in MATURITY_COLORS.items()}
+
+
+def score_bar_table(score: float, color: str, width: float = 10 * cm):
+    """Renders a visual score bar as a table."""
+    filled = score / 10.0
+    inner_style, outer_style = SCORE_BAR_STYLES.get(color, SCORE_BAR_STYLES["blue"])
+    t = Table([[""]], colWidths=[width * filled], rowHeights=[10])
+    t.setStyle(inner_style)
+    # Wrap in outer table with grey background
+    outer = Table([[t, ""]], colWidths=[width * filled, width * (1 - filled)], rowHeights=[10])
+    outer.setStyle(outer_style)
     return outer
 
 
 def bullet_list(items: list[str], styles, prefix="•") -> list:
-    """Returns a list of Paragraph flowables for a bullet list."""
-    return [
-        Paragraph(f"{prefix} {item}", styles["bullet"])
-        for item in items if item
-    ]
+    """
+    Returns a bullet list as a single Paragraph (one line per item, joined
+    with <br/>), or no flowables when there are no items.
+    """
+    lines = [f"{prefix} {escape(item)}" for item in items if item]
+    return [Paragraph("<br/>".join(lines), styles["bullet"])] if lines else []
 
 
 # ---------------------------------------------------------------------------
@@ -134,13 +181,10 @@ def cover_page(report: AssessmentReport, styles) -> list:
     elements.append(Spacer(1, 1 * cm))
 
     # Score callout
-    score_color = MATURITY_COLORS.get(report.overall_maturity_color, BRAND_BLUE)
+    mat_style = styles.get(f"mat_{report.overall_maturity_color}", styles["mat_blue"])
     score_data = [[
         Paragraph(f"{report.overall_score}/10", styles["score_big"]),
-        Paragraph(report.overall_maturity, ParagraphStyle(
-            "mat", fontSize=20, textColor=score_color,
-            alignment=TA_CENTER, leading=24,
-        )),
+        Paragraph(report.overall_maturity, mat_style),
     ]]
     score_table = Table(score_data, colWidths=[6 * cm, 6 * cm], rowHeights=[5 * cm])
     score_table.setStyle(TableStyle([
@@ -155,7 +199,7 @@ def cover_page(report: AssessmentReport, styles) -> list:
 
     meta_data = [
         ["Report ID", report.report_id],
-        ["Generated", datetime.fromisoformat(report.generated_at).strftime("%d %B %Y, %H:%M UTC")],
+        ["Generated", report.generated_at_dt.strftime("%d %B %Y, %H:%M UTC")],
         ["Documents Analysed", str(len(report.documents_analysed))],
         ["Pages Reviewed", str(report.total_pages_analysed)],
     ]
@@ -242,7 +286,7 @@ def use_cases_section(report: AssessmentReport, styles) -> list:
                 Spacer(1, 0.4 * cm)]
 
     headers = ["#", "Use Case", "AI Approach", "Complexity", "ROI Impact"]
-    rows = [headers]
+    rows = []
     for uc in sorted(report.use_case_candidates, key=lambda x: x.priority_rank):
         rows.append([
             str(uc.priority_rank),
@@ -254,7 +298,6 @@ def use_cases_section(report: AssessmentReport, styles) -> list:
 
     complexity_colors = {"Low": BRAND_GREEN, "Medium": BRAND_ORANGE, "High": BRAND_RED}
 
-    t = Table(rows, colWidths=[1*cm, 8*cm, 3.5*cm, 2.5*cm, 2.5*cm])
     style_cmds = [
         ("FONTSIZE", (0, 0), (-1, -1), 9),
         ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
@@ -266,8 +309,14 @@ def use_cases_section(report: AssessmentReport, styles) -> list:
         ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
         ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, BRAND_LIGHT]),
     ]
-    t.setStyle(TableStyle(style_cmds))
-    elements.append(t)
+    table_style = TableStyle(style_cmds)
+    for start in range(0, max(len(rows), 1), TABLE_CHUNK_ROWS):
+        t = Table([headers] + rows[start:start + TABLE_CHUNK_ROWS],
+                  colWidths=[1*cm, 8*cm, 3.5*cm, 2.5*cm, 2.5*cm])
+        t.setStyle(table_style)
+        if start:
+            elements.append(Spacer(1, 0))
+        elements.append(t)
     elements.append(PageBreak())
     return elements
 
@@ -277,13 +326,11 @@ def roadmap_section(report: AssessmentReport, styles) -> list:
                 HRFlowable(width="100%", thickness=1, color=BRAND_LIGHT),
                 Spacer(1, 0.4 * cm)]
 
-    phase_colors = [BRAND_BLUE, BRAND_GREEN, colors.HexColor("#8b5cf6")]
-
     for phase in report.roadmap_phases:
-        color = phase_colors[(phase.phase - 1) % len(phase_colors)]
+        phase_style = styles[f"phase_{(phase.phase - 1) % len(PHASE_COLORS)}"]
         elements.append(Paragraph(
             f"<b>Phase {phase.phase}: {phase.title}</b>  ·  {phase.timeline}",
-            ParagraphStyle("ph", fontSize=12, textColor=color, spaceBefore=8, spaceAfter=4),
+            phase_style,
         ))
 
         phase_data = [
@@ -313,30 +360,80 @@ def roadmap_section(report: AssessmentReport, styles) -> list:
 # Main export function
 # ---------------------------------------------------------------------------
 
-def generate_pdf_report(report: AssessmentReport) -> str:
-    """
-    Generates a PDF report and saves it to the reports directory.
-    Returns the file path.
-    """
-    os.makedirs(settings.reports_dir, exist_ok=True)
-    filename = f"{settings.reports_dir}/{report.report_id}_{report.organisation_name.replace(' ', '_')}.pdf"
-    styles = build_styles()
+# Anything but word characters and hyphens is replaced in report filenames
+_SAFE_NAME = re.compile(r"[^\w-]+")
+
+SECTIONS = (
+    cover_page,
+    exec_summary_section,
+    dimensions_summary_section,
+    use_cases_section,
+    roadmap_section,
+)
+
+# Reports with fewer use cases render inline even with pdf_parallel_sections;
+# a typical report builds in ~20 ms, less than handing it to the workers costs
+PARALLEL_MIN_USE_CASES = 200
+
 
-    doc = SimpleDocTemplate(
-        filename,
+def _document(target) -> SimpleDocTemplate:
+    return SimpleDocTemplate(
+        target,
         pagesize=A4,
         rightMargin=2 * cm,
         leftMargin=2 * cm,
         topMargin=2 * cm,
         bottomMargin=2 * cm,
+        pageCompression=1,   # Flate-compress page streams whatever the site rl_config says
     )
 
+
+@lru_cache(maxsize=1)
+def _section_pool() -> ProcessPoolExecutor:
+    # Started on first use and reused by every later report. Spawned workers
+    # avoid forking the API server's threads.
+    return ProcessPoolExecutor(
+        max_workers=min(len(SECTIONS), os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def _render_section(index: int, report: AssessmentReport) -> bytes:
+    """Renders one section as a standalone PDF (runs in a worker process)."""
+    buf = io.BytesIO()
+    _document(buf).build(SECTIONS[index](report, build_styles()))
+    return buf.getvalue()
+
+
+def generate_pdf_report(report: AssessmentReport, output: BinaryIO | None = None) -> str | BinaryIO:
+    """
+    Generates a PDF report. With ``output`` (a BytesIO or response stream) the
+    PDF is written straight into it and the stream is returned; otherwise it is
+    saved to the reports directory and the file path is returned.
+    """
+    if output is None:
+        os.makedirs(settings.reports_dir, exist_ok=True)
+        target = f"{settings.reports_dir}/{report.report_id}_{_SAFE_NAME.sub('_', report.organisation_name)}.pdf"
+    else:
+        target = output
+
+    if settings.pdf_parallel_sections and len(report.use_case_candidates) >= PARALLEL_MIN_USE_CASES:
+        # Every section ends on a page break, so rendering them separately and
+        # concatenating gives the same pages. ReportLab layout holds the GIL,
+        # hence processes rather than threads.
+        parts = list(_section_pool().map(_render_section, range(len(SECTIONS)), repeat(report)))
+        writer = PdfWriter()
+        for part in parts:
+            writer.append(io.BytesIO(part))
+        # Each part embeds its own copy of the fonts and resources
+        writer.compress_identical_objects()
+        writer.write(target)
+        return target
+
+    styles = build_styles()
     elements = []
-    elements += cover_page(report, styles)
-    elements += exec_summary_section(report, styles)
-    elements += dimensions_summary_section(report, styles)
-    elements += use_cases_section(report, styles)
-    elements += roadmap_section(report, styles)
-
-    doc.build(elements)
-    return filename
+    for section in SECTIONS:
+        elements += section(report, styles)
+
+    _document(target).build(elements)
+    return target
@@ -9,19 +9,52 @@ Flow: Extract text → Clean → Chunk → Embed → Store in ChromaDB
 In production: extend with SharePoint connector, Confluence API, S3 bucket reader.
 """
 
+import io
+import os
 import re
+import pickle
+import zipfile
+import tempfile
+import threading
 import hashlib
 import logging
+import multiprocessing
 from pathlib import Path
-from dataclasses import dataclass
+from typing import IO, Callable, Iterator
+from functools import lru_cache
+from dataclasses import dataclass, replace
+from itertools import chain, islice
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 import chromadb
+import diskcache
 from chromadb.utils import embedding_functions
+from rank_bm25 import BM25Plus
 
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+_PARA_RE = re.compile(r"\n\n+")
+
+# Chunks per ChromaDB upsert; one embedding pass covers the whole batch
+UPSERT_BATCH_SIZE = 512
+
+# Batches smaller than this on disk are extracted inline; below it, handing
+# files to worker processes costs more than it saves
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+# Chunk prefix stored at ingest time and quoted as evidence in prompts
+DISPLAY_CHARS = 600
+
+# Fields returned by semantic queries
+_QUERY_INCLUDE = ["documents", "metadatas", "distances"]
+
+# In-process BM25 indexes keyed on session_id: (index, chunk records).
+# Writers hold the lock; searches run in worker threads alongside ingests.
+_keyword_indexes: dict[str, tuple[BM25Plus, list[dict]]] = {}
+_keyword_index_lock = threading.Lock()
+
 
 # ---------------------------------------------------------------------------
 # Extracted document
@@ -39,80 +72,174 @@ class ExtractedDocument:
 # Extractors
 # ---------------------------------------------------------------------------
 
-def extract_pdf(path: Path) -> ExtractedDocument:
-    """Extract text from PDF using pypdf."""
+def _read_pdf_pages(path: Path) -> Iterator[str]:
+    """Yields page text, via PyMuPDF when installed (much faster), else pypdf."""
     try:
+        import pymupdf
+    except ImportError:
         from pypdf import PdfReader
-        reader = PdfReader(str(path))
-        pages = []
-        for i, page in enumerate(reader.pages):
-            text = page.extract_text() or ""
+        for page in PdfReader(str(path), strict=False).pages:
+            yield page.extract_text() or ""
+        return
+    with pymupdf.open(str(path)) as doc:
+        for page in doc:
+            yield page.get_text("text")
+
+
+def extract_pdf(path: Path) -> ExtractedDocument:
+    """Extract text from PDF using PyMuPDF, or pypdf if it isn't installed."""
+    try:
+        # Single pass: pages are counted and written out as they are read
+        content = io.StringIO()
+        page_count = 0
+        for page_count, text in enumerate(_read_pdf_pages(path), start=1):
             if text.strip():
-                pages.append(f"[Page {i+1}]\n{text}")
+                if content.tell():
+                    content.write("\n\n")
+                content.write(f"[Page {page_count}]\n")
+                content.write(text)
         return ExtractedDocument(
             filename=path.name,
-            content="\n\n".join(pages),
-            page_count=len(reader.pages),
+            content=content.getvalue(),
+            page_count=page_count,
             file_type="pdf",
         )
     except Exception as e:
         raise ValueError(f"Failed to extract PDF {path.name}: {e}")
 
 
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_NS = {"w": _W[1:-1]}
+
+
+def _docx_text(element) -> str:
+    """Run text under a w:p, with tabs and breaks rendered as python-docx does."""
+    parts = []
+    for node in element.iterfind(".//w:r/*", _W_NS):
+        if node.tag == f"{_W}t":
+            parts.append(node.text or "")
+        elif node.tag == f"{_W}tab":
+            parts.append("\t")
+        elif node.tag in (f"{_W}br", f"{_W}cr"):
+            parts.append("\n")
+    return "".join(parts)
+
+
 def extract_docx(path: Path) -> ExtractedDocument:
-    """Extract text from DOCX preserving heading structure."""
+    """
+    Extract text from DOCX preserving heading structure.
+    Reads word/document.xml directly with lxml rather than through
+    python-docx's per-element proxies.
+    """
     try:
-        from docx import Document
-        doc = Document(str(path))
+        from lxml import etree
+        with zipfile.ZipFile(path) as zf:
+            body = etree.fromstring(zf.read("word/document.xml")).find("w:body", _W_NS)
+            # Paragraphs reference styles by id; headings are matched on name
+            # (stored lower-case for built-ins, e.g. "heading 1")
+            style_names = {}
+            if "word/styles.xml" in zf.namelist():
+                for style in etree.fromstring(zf.read("word/styles.xml")).iterfind("w:style", _W_NS):
+                    name = style.find("w:name", _W_NS)
+                    if name is not None:
+                        style_names[style.get(f"{_W}styleId")] = name.get(f"{_W}val")
+
         sections = []
-        for para in doc.paragraphs:
-            if para.text.strip():
-                prefix = "## " if para.style.name.startswith("Heading") else ""
-                sections.append(f"{prefix}{para.text}")
+        paragraphs = body.findall("w:p", _W_NS)
+        for para in paragraphs:
+            text = _docx_text(para)
+            if text.strip():
+                style = para.find("w:pPr/w:pStyle", _W_NS)
+                style_name = style_names.get(style.get(f"{_W}val"), "") if style is not None else ""
+                prefix = "## " if style_name.lower().startswith("heading") else ""
+                sections.append(f"{prefix}{text}")
         # Also extract tables
-        for table in doc.tables:
-            for row in table.rows:
-                row_text = " | ".join(cell.text.strip() for cell in row.cells if cell.text.strip())
+        for table in body.iterfind("w:tbl", _W_NS):
+            for row in table.iterfind("w:tr", _W_NS):
+                cells = (
+                    "\n".join(_docx_text(p) for p in cell.iterfind("w:p", _W_NS)).strip()
+                    for cell in row.iterfind("w:tc", _W_NS)
+                )
+                row_text = " | ".join(c for c in cells if c)
                 if row_text:
                     sections.append(row_text)
         return ExtractedDocument(
             filename=path.name,
             content="\n".join(sections),
-            page_count=len(doc.paragraphs) // 25 + 1,  # Estimate
+            page_count=len(paragraphs) // 25 + 1,  # Estimate
             file_type="docx",
         )
     except Exception as e:
         raise ValueError(f"Failed to extract DOCX {path.name}: {e}")
 
 
-def extract_txt(path: Path) -> ExtractedDocument:
-    """Extract plain text."""
-    content = path.read_text(encoding="utf-8", errors="ignore")
+def _read_source(src) -> str:
+    """Text of a path or of an open (text or binary) file object."""
+    if hasattr(src, "read"):
+        data = src.read()
+        return data.decode("utf-8", errors="ignore") if isinstance(data, bytes) else data
+    with open(src, encoding="utf-8", errors="ignore") as f:
+        return f.read()
+
+
+def extract_txt(src: Path | IO, filename: str | None = None) -> ExtractedDocument:
+    """Extract plain text from a path or file object (pass ``filename`` for unnamed streams)."""
+    content = _read_source(src)
     return ExtractedDocument(
-        filename=path.name,
+        filename=filename or Path(getattr(src, "name", src)).name,
         content=content,
         page_count=max(1, len(content) // 3000),
         file_type="txt",
     )
 
 
+_EXTRACTORS: dict[str, Callable[[Path], ExtractedDocument]] = {
+    ".pdf": extract_pdf,
+    ".docx": extract_docx,
+    ".doc": extract_docx,
+    ".txt": extract_txt,
+    ".md": extract_txt,
+}
+
+
 def extract_document(path: Path) -> ExtractedDocument:
     """Route to the correct extractor based on file extension."""
     suffix = path.suffix.lower()
-    if suffix == ".pdf":
-        return extract_pdf(path)
-    elif suffix in (".docx", ".doc"):
-        return extract_docx(path)
-    elif suffix in (".txt", ".md"):
-        return extract_txt(path)
-    else:
-        raise ValueError(f"Unsupported file type: {suffix}. Supported: pdf, docx, txt, md")
+    try:
+        extractor = _EXTRACTORS[suffix]
+    except KeyError:
+        raise ValueError(f"Unsupported file type: {suffix}. Supported: pdf, docx, txt, md") from None
+    return extractor(path)
 
 
 # ---------------------------------------------------------------------------
 # Chunker
 # ---------------------------------------------------------------------------
 
+def _split_words(text: str, size: int) -> list[str]:
+    """
+    Splits text into pieces of at most ``size`` characters on word boundaries
+    (a single longer word becomes its own piece). Whitespace is collapsed to
+    single spaces, and break points are found with str.rfind rather than by
+    walking word by word.
+    """
+    text = " ".join(text.split())
+    pieces = []
+    start = 0
+    while len(text) - start > size:
+        end = start + size
+        if text[end] != " ":
+            end = text.rfind(" ", start, end)
+            if end == -1:
+                end = text.find(" ", start + size)
+                if end == -1:
+                    break
+        pieces.append(text[start:end])
+        start = end + 1
+    pieces.append(text[start:])
+    return pieces
+
+
 def chunk_text(
     text: str,
     chunk_size: int = None,
@@ -126,35 +253,30 @@ def chunk_text(
     chunk_overlap = chunk_overlap or settings.chunk_overlap
 
     # Split on double newlines (paragraphs) first
-    paragraphs = [p.strip() for p in re.split(r'\n\n+', text) if p.strip()]
+    paragraphs = [p.strip() for p in _PARA_RE.split(text) if p.strip()]
 
+    # Pieces are collected in lists and joined once per chunk; the lengths
+    # track what the joined string would measure.
     chunks = []
-    current = ""
+    current, current_len = [], 0
 
     for para in paragraphs:
-        if len(current) + len(para) <= chunk_size:
-            current = f"{current}\n\n{para}".strip()
+        if current_len + len(para) <= chunk_size:
+            current_len += len(para) + (2 if current else 0)
+            current.append(para)
         else:
             if current:
-                chunks.append(current)
+                chunks.append("\n\n".join(current))
             # If the paragraph itself is too long, split it further
             if len(para) > chunk_size:
-                words = para.split()
-                sub = ""
-                for word in words:
-                    if len(sub) + len(word) + 1 <= chunk_size:
-                        sub = f"{sub} {word}".strip()
-                    else:
-                        if sub:
-                            chunks.append(sub)
-                        sub = word
-                if sub:
-                    current = sub
+                *full, last = _split_words(para, chunk_size)
+                chunks.extend(full)
+                current, current_len = [last], len(last)
             else:
-                current = para
+                current, current_len = [para], len(para)
 
     if current:
-        chunks.append(current)
+        chunks.append("\n\n".join(current))
 
     # Add overlap: prepend tail of previous chunk to next
     overlapped = []
@@ -168,21 +290,172 @@ def chunk_text(
     return overlapped
 
 
+# ---------------------------------------------------------------------------
+# Extraction cache
+# ---------------------------------------------------------------------------
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a file's bytes, read in 1 MB blocks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _extraction_cache() -> diskcache.Cache:
+    return diskcache.Cache(str(Path(settings.chroma_persist_dir) / "extraction_cache"))
+
+
+def extract_and_chunk(path: Path, digest: str) -> tuple[ExtractedDocument, list[str]]:
+    """
+    Extract and chunk a file, reusing the stored result when the same content
+    (and chunking settings) has been ingested before.
+    """
+    key = f"{digest}{path.suffix.lower()}:{settings.chunk_size}:{settings.chunk_overlap}"
+    cached = _extraction_cache().get(key)
+    if cached is not None:
+        doc, chunks = cached
+        return replace(doc, filename=path.name), chunks
+    doc = extract_document(path)
+    chunks = chunk_text(doc.content)
+    _extraction_cache().set(key, (doc, chunks))
+    return doc, chunks
+
+
 # ---------------------------------------------------------------------------
 # ChromaDB store
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
+def _client():
+    return chromadb.PersistentClient(path=settings.chroma_persist_dir)
+
+
+@lru_cache(maxsize=1)
+def _embedding_function():
+    if settings.embedding_model:
+        # sentence-transformers model, on the GPU when one is available
+        import torch
+        return embedding_functions.SentenceTransformerEmbeddingFunction(
+            model_name=settings.embedding_model,
+            device="cuda" if torch.cuda.is_available() else "cpu",
+        )
+    return embedding_functions.DefaultEmbeddingFunction()
+
+
+@lru_cache(maxsize=32)
 def get_collection(session_id: str):
-    """Get or create a ChromaDB collection scoped to a session."""
-    client = chromadb.PersistentClient(path=settings.chroma_persist_dir)
-    ef = embedding_functions.DefaultEmbeddingFunction()
+    """
+    Get or create a ChromaDB collection scoped to a session.
+    The client, embedding model and recent collection handles are reused
+    across calls instead of being reopened for every search.
+    """
     collection_name = f"{settings.collection_name}_{session_id[:8]}"
-    return client.get_or_create_collection(
+    return _client().get_or_create_collection(
         name=collection_name,
-        embedding_function=ef,
+        embedding_function=_embedding_function(),
+    )
+
+
+def _tokenize(text: str) -> list[str]:
+    return re.findall(r"\w+", text.lower())
+
+
+def _keyword_index_path(session_id: str) -> Path:
+    # Stored next to the session's Chroma collection, under the same name
+    return Path(settings.chroma_persist_dir) / "keyword_index" / f"{settings.collection_name}_{session_id[:8]}.pkl"
+
+
+def _load_keyword_index(session_id: str) -> bool:
+    """Load a session's BM25 index saved at ingest time, if there is one."""
+    path = _keyword_index_path(session_id)
+    if not path.exists():
+        return False
+    with path.open("rb") as f:
+        entry = pickle.load(f)
+    with _keyword_index_lock:
+        _keyword_indexes.setdefault(session_id, entry)
+    return True
+
+
+def build_keyword_index(session_id: str, documents: list[str], metadatas: list[dict]) -> None:
+    """Build (or replace) the BM25 index over a session's chunks and save it to disk."""
+    path = _keyword_index_path(session_id)
+    if not documents:
+        with _keyword_index_lock:
+            _keyword_indexes.pop(session_id, None)
+            path.unlink(missing_ok=True)
+        return
+    records = [
+        {
+            "content": doc,
+            "display_text": meta.get("display_text", doc[:DISPLAY_CHARS]),
+            "source": meta.get("source", "unknown"),
+        }
+        for doc, meta in zip(documents, metadatas)
+    ]
+    entry = (BM25Plus([_tokenize(d) for d in documents]), records)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _keyword_index_lock:
+        # Written to a sibling temp file and renamed into place, so a reader in
+        # another thread or process never sees a half-written pickle
+        with tempfile.NamedTemporaryFile("wb", dir=path.parent, suffix=".tmp", delete=False) as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f.name, path)
+        _keyword_indexes[session_id] = entry
+
+
+@lru_cache(maxsize=1)
+def _process_pool() -> ProcessPoolExecutor:
+    # Started on first use and reused by every later ingest. Spawned workers
+    # avoid forking the API server's threads.
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
     )
 
 
+def _total_size(paths: list[Path]) -> int:
+    return sum(p.stat().st_size for p in paths if p.is_file())
+
+
+def _process_one(path: Path) -> tuple[ExtractedDocument, list[str], str]:
+    """Extract and chunk one file; returns (doc, chunks, content hash)."""
+    digest = file_digest(path)
+    doc, chunks = extract_and_chunk(path, digest)
+    logger.info(f"Extracted {path.name}: {len(doc.content)} chars, {doc.page_count} pages")
+    logger.info(f"Chunked {path.name} into {len(chunks)} chunks")
+    return doc, chunks, digest
+
+
+def iter_chunk_records(
+    doc: ExtractedDocument, chunks: list[str], digest: str, session_id: str,
+) -> Iterator[tuple[str, str, dict]]:
+    """Yields (id, text, metadata) for each chunk of a document."""
+    for j, chunk in enumerate(chunks):
+        # 16-byte BLAKE2b keeps the 32-hex-char id length of the old MD5 ids
+        chunk_id = hashlib.blake2b(f"{session_id}:{doc.filename}:{j}".encode(), digest_size=16).hexdigest()
+        yield chunk_id, chunk, {
+            "source": doc.filename,
+            "file_type": doc.file_type,
+            "chunk_index": j,
+            "session_id": session_id,
+            "display_text": chunk[:DISPLAY_CHARS],
+            "content_hash": digest,
+            # Per-chunk text digest: the same file can chunk differently when
+            # chunk_size / chunk_overlap change, and the stored embedding must follow
+            "chunk_hash": hashlib.blake2b(chunk.encode(), digest_size=16).hexdigest(),
+        }
+
+
+def _batched(iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
 def ingest_documents(
     file_paths: list[Path],
     session_id: str,
@@ -199,50 +472,73 @@ def ingest_documents(
     Returns:
         (list of ExtractedDocuments, total chunk count)
     """
-    collection = get_collection(session_id)
-    extracted_docs = []
-    total_chunks = 0
-
-    for i, path in enumerate(file_paths):
-        if progress_callback:
-            pct = int((i / len(file_paths)) * 40)
-            progress_callback(f"Extracting {path.name}...", pct)
-
-        try:
-            doc = extract_document(path)
-            extracted_docs.append(doc)
-            logger.info(f"Extracted {path.name}: {len(doc.content)} chars, {doc.page_count} pages")
-        except Exception as e:
-            logger.error(f"Skipping {path.name}: {e}")
+    # Extraction and chunking are CPU-bound, so large batches are processed in
+    # worker processes; only the main process talks to ChromaDB.
+    results = [None] * len(file_paths)
+    parallel = (
+        len(file_paths) > 1
+        and (os.cpu_count() or 1) > 1
+        and _total_size(file_paths) >= PARALLEL_MIN_BYTES
+    )
+    if parallel:
+        pool = _process_pool()
+        futures = {pool.submit(_process_one, path): i for i, path in enumerate(file_paths)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            path = file_paths[futures[future]]
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                logger.error(f"Skipping {path.name}: {e}")
+            if progress_callback:
+                progress_callback(f"Processed {path.name}", int(done / len(file_paths) * 40))
+    else:
+        for i, path in enumerate(file_paths):
+            if progress_callback:
+                pct = int((i / len(file_paths)) * 40)
+                progress_callback(f"Extracting {path.name}...", pct)
+            try:
+                results[i] = _process_one(path)
+            except Exception as e:
+                logger.error(f"Skipping {path.name}: {e}")
+
+    # Chunk ids are keyed on filename, so two uploads with the same name would
+    # collide within one upsert batch; the later upload wins, as it would on disk
+    by_name: dict[str, tuple] = {}
+    for r in results:
+        if r is None:
             continue
-
-        # Chunk
-        chunks = chunk_text(doc.content)
-        logger.info(f"Chunked {path.name} into {len(chunks)} chunks")
-
-        # Store in ChromaDB
-        ids, documents, metadatas = [], [], []
-        for j, chunk in enumerate(chunks):
-            chunk_id = hashlib.md5(f"{session_id}:{path.name}:{j}".encode()).hexdigest()
-            ids.append(chunk_id)
-            documents.append(chunk)
-            metadatas.append({
-                "source": path.name,
-                "file_type": doc.file_type,
-                "chunk_index": j,
-                "session_id": session_id,
-            })
-
-        # Upsert in batches of 100
-        batch_size = 100
-        for b in range(0, len(ids), batch_size):
+        if r[0].filename in by_name:
+            logger.warning(f"Duplicate filename {r[0].filename}; keeping the later upload")
+            del by_name[r[0].filename]
+        by_name[r[0].filename] = r
+    results = list(by_name.values())
+    extracted_docs = [doc for doc, _, _ in results]
+    total_chunks = sum(len(chunks) for _, chunks, _ in results)
+
+    # Chunk records are generated lazily and embedded one fixed-size batch at
+    # a time. Chunks already stored with identical metadata (same file
+    # content, same position, same chunk text) are not embedded again.
+    collection = get_collection(session_id)
+    records = chain.from_iterable(iter_chunk_records(*r, session_id) for r in results)
+    reused = 0
+    for batch in _batched(records, UPSERT_BATCH_SIZE):
+        ids, documents, metadatas = map(list, zip(*batch))
+        stored = collection.get(ids=ids, include=["metadatas"])
+        stored_meta = dict(zip(stored["ids"], stored["metadatas"]))
+        pending = [k for k, chunk_id in enumerate(ids) if stored_meta.get(chunk_id) != metadatas[k]]
+        reused += len(ids) - len(pending)
+        if pending:
             collection.upsert(
-                ids=ids[b:b+batch_size],
-                documents=documents[b:b+batch_size],
-                metadatas=metadatas[b:b+batch_size],
+                ids=[ids[k] for k in pending],
+                documents=[documents[k] for k in pending],
+                metadatas=[metadatas[k] for k in pending],
             )
+    logger.info(f"{reused} of {total_chunks} chunks already embedded")
 
-        total_chunks += len(chunks)
+    # The BM25 index covers everything in the collection, including chunks
+    # from earlier ingests into this session, so it matches semantic search
+    stored = collection.get(include=["documents", "metadatas"])
+    build_keyword_index(session_id, stored["documents"], stored["metadatas"])
 
     if progress_callback:
         progress_callback("Documents indexed in vector store.", 45)
@@ -250,23 +546,120 @@ def ingest_documents(
     return extracted_docs, total_chunks
 
 
+def _keyword_only(session_id: str) -> bool:
+    """
+    True when the session is small enough (keyword_only_max_chunks) that BM25
+    alone answers searches, skipping query embedding and the ANN lookup.
+    """
+    if settings.keyword_only_max_chunks <= 0:
+        return False
+    if session_id not in _keyword_indexes and not _load_keyword_index(session_id):
+        return False
+    entry = _keyword_indexes.get(session_id)
+    return entry is not None and len(entry[1]) < settings.keyword_only_max_chunks
+
+
 def search_documents(query: str, session_id: str, n_results: int = None) -> list[dict]:
     """
     Semantic search over ingested documents for a given session.
-    Returns list of {content, source, distance} dicts.
+    Returns list of {content, display_text, source, distance} dicts
+    (BM25 hits with a score instead of a distance for small sessions).
     """
     n_results = n_results or settings.top_k_retrieval
+    if _keyword_only(session_id):
+        return keyword_search_documents(query, session_id, n_results)
     try:
         collection = get_collection(session_id)
-        results = collection.query(query_texts=[query], n_results=min(n_results, collection.count()))
+        # No count() clamp: ChromaDB returns fewer hits when the collection is
+        # smaller. Embeddings are left out of the reply.
+        results = collection.query(query_texts=[query], n_results=n_results, include=_QUERY_INCLUDE)
         out = []
         for i, doc in enumerate(results["documents"][0]):
+            meta = results["metadatas"][0][i]
             out.append({
                 "content": doc,
-                "source": results["metadatas"][0][i].get("source", "unknown"),
+                "display_text": meta.get("display_text", doc[:DISPLAY_CHARS]),
+                "source": meta.get("source", "unknown"),
                 "distance": results["distances"][0][i],
             })
         return out
     except Exception as e:
         logger.error(f"Search error: {e}")
         return []
+
+
+def batch_search_documents(
+    queries: list[str],
+    session_id: str,
+    n_results: int = None,
+) -> dict[str, list[dict]]:
+    """
+    Runs several semantic searches in one round trip — the queries are
+    embedded together and sent to ChromaDB as a single multi-vector query.
+    Returns {query: [{content, display_text, source, distance}, ...]}.
+    """
+    n_results = n_results or settings.top_k_retrieval
+    if _keyword_only(session_id):
+        return {query: keyword_search_documents(query, session_id, n_results) for query in queries}
+    try:
+        collection = get_collection(session_id)
+        results = collection.query(query_texts=queries, n_results=n_results, include=_QUERY_INCLUDE)
+        out = {}
+        for q, query in enumerate(queries):
+            out[query] = [
+                {
+                    "content": doc,
+                    "display_text": meta.get("display_text", doc[:DISPLAY_CHARS]),
+                    "source": meta.get("source", "unknown"),
+                    "distance": distance,
+                }
+                for doc, meta, distance in zip(
+                    results["documents"][q], results["metadatas"][q], results["distances"][q]
+                )
+            ]
+        return out
+    except Exception as e:
+        logger.error(f"Batch search error: {e}")
+        return {query: [] for query in queries}
+
+
+def keyword_search_documents(query: str, session_id: str, n_results: int = None) -> list[dict]:
+    """
+    BM25 keyword search over a session's chunks — catches exact terms
+    (e.g. "RPA", "MLOps") that embeddings can rank poorly.
+    Returns list of {content, display_text, source, score} dicts, best first.
+    """
+    n_results = n_results or settings.top_k_retrieval
+    try:
+        if session_id not in _keyword_indexes and not _load_keyword_index(session_id):
+            # Nothing saved for this session (e.g. ingested before indexes were
+            # persisted) — rebuild from the store
+            stored = get_collection(session_id).get(include=["documents", "metadatas"])
+            build_keyword_index(session_id, stored["documents"], stored["metadatas"])
+        entry = _keyword_indexes.get(session_id)
+        if entry is None:
+            return []
+        index, records = entry
+        tokens = _tokenize(query)
+        scores = index.get_scores(tokens)
+        # Only chunks sharing at least one term with the query count as hits
+        hits = [i for i, freqs in enumerate(index.doc_freqs) if any(t in freqs for t in tokens)]
+        ranked = sorted(hits, key=scores.__getitem__, reverse=True)[:n_results]
+        return [{**records[i], "score": float(scores[i])} for i in ranked]
+    except Exception as e:
+        logger.error(f"Keyword search error: {e}")
+        return []
+
+
+def reciprocal_rank_fusion(rankings: list[list[dict]], k: int = 60) -> list[dict]:
+    """
+    Fuse several ranked result lists: score(c) = sum(1 / (k + rank_i(c))).
+    Chunks are matched on content; returns the fused list, best first.
+    """
+    scores: dict[str, float] = {}
+    results: dict[str, dict] = {}
+    for ranking in rankings:
+        for rank, r in enumerate(ranking, start=1):
+            scores[r["content"]] = scores.get(r["content"], 0.0) + 1.0 / (k + rank)
+            results.setdefault(r["content"], r)
+    return [results[c] for c in sorted(scores, key=scores.__getitem__, reverse=True)]
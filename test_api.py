@@ -0,0 +1,60 @@
+"""
+tests/test_api.py
+=================
+API tests (mocked LLM) for the AI Readiness Advisor.
+All tests run without a live Anthropic API key; `client` is the
+session-scoped fixture in conftest.py (one per xdist worker).
+
+Run: pytest tests/ -n auto
+"""
+
+import io
+
+import orjson
+import pytest
+
+# The client fixture and its app lifespan live on one session-wide event loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+class TestAPI:
+
+    async def test_health_endpoint(self, client):
+        resp = await client.get("/health")
+        assert resp.status_code == 200
+        assert orjson.loads(resp.content)["status"] == "healthy"
+
+    @pytest.mark.parametrize("method,path,headers,expected_status", [
+        ("post", "/v1/assessment/upload", {}, 403),
+        ("post", "/v1/assessment/upload", {"X-API-Key": "wrong-key"}, 403),
+        ("get", "/v1/assessment/nonexistent-session-id", {"X-API-Key": "sk-advisor-demo-001"}, 404),
+    ], ids=["upload-requires-auth", "upload-wrong-key", "nonexistent-session"])
+    async def test_request_status(self, client, method, path, headers, expected_status):
+        resp = await getattr(client, method)(path, headers=headers)
+        assert resp.status_code == expected_status
+
+    async def test_upload_unsupported_file_type(self, client):
+        resp = await client.post(
+            "/v1/assessment/upload",
+            headers={"X-API-Key": "sk-advisor-demo-001"},
+            files=[("files", ("test.xlsx", io.BytesIO(b"fake xlsx content"), "application/vnd.ms-excel"))],
+            data={"organisation_name": "Test Corp"},
+        )
+        assert resp.status_code == 400
+        assert "Unsupported file type" in orjson.loads(resp.content)["detail"]
+
+    async def test_upload_valid_txt_file(self, client, monkeypatch):
+        # Only the API contract is under test; keep ingestion to a stub chunk
+        monkeypatch.setattr("ingestion.pipeline.chunk_text", lambda text, *args, **kwargs: ["stub"])
+        resp = await client.post(
+            "/v1/assessment/upload",
+            headers={"X-API-Key": "sk-advisor-demo-001"},
+            files=[("files", ("strategy.txt", io.BytesIO(b"Our data strategy."), "text/plain"))],
+            data={"organisation_name": "Test Corp"},
+        )
+        # Should return 200 with session_id (assessment runs async)
+        assert resp.status_code == 200
+        data = orjson.loads(resp.content)
+        assert "session_id" in data
+        assert data["status"] == "processing"
+        assert "strategy.txt" in data["files_received"]
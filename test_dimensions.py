@@ -0,0 +1,20 @@
+"""
+tests/test_dimensions.py
+========================
+Dimension description coverage for the AI Readiness Advisor.
+All tests run without a live Anthropic API key.
+
+Run: pytest tests/ -n auto
+"""
+
+from models import Dimension, get_dimension_description
+
+
+class TestDimensionCoverage:
+    def test_all_dimensions_have_descriptions(self):
+        for dim in Dimension.__members__.values():
+            description = get_dimension_description(dim)
+            assert len(description) > 20
+
+    def test_all_dimensions_count(self):
+        assert len(Dimension.__members__) == 6
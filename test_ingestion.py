@@ -0,0 +1,80 @@
+"""
+tests/test_ingestion.py
+=======================
+Ingestion tests for the AI Readiness Advisor.
+All tests run without a live Anthropic API key.
+
+Run: pytest tests/ -n auto
+"""
+
+import io
+from pathlib import Path
+from unittest.mock import mock_open, patch
+
+import pytest
+
+# ~18 KB of prose in ten paragraphs, built once for the chunk-size sweep
+_LONG_TEXT = ("This is a sentence with many words. " * 50 + "\n\n") * 10
+
+
+class TestIngestion:
+
+    def test_extract_txt(self):
+        from ingestion.pipeline import extract_txt
+        src = io.StringIO("Hello, this is a test document with important content.")
+        doc = extract_txt(src, filename="test.txt")
+        assert doc.filename == "test.txt"
+        assert "Hello" in doc.content
+        assert doc.file_type == "txt"
+        assert doc.page_count >= 1
+
+    def test_extract_txt_from_path(self):
+        from ingestion.pipeline import extract_txt
+        with patch("ingestion.pipeline.open", mock_open(read_data="Hello from disk.")):
+            doc = extract_txt(Path("notes/test.txt"))
+        assert doc.filename == "test.txt"
+        assert doc.content == "Hello from disk."
+
+    def test_unsupported_file_type_raises(self):
+        from ingestion.pipeline import extract_document
+        # Rejected on the suffix alone; the file is never opened
+        with pytest.raises(ValueError, match="Unsupported file type"):
+            extract_document(Path("test.xlsx"))
+
+    @pytest.mark.parametrize("size,overlap", [(300, 30), (500, 50), (800, 80)])
+    def test_chunker_splits_long_text(self, size, overlap):
+        from ingestion.pipeline import chunk_text
+        chunks = chunk_text(_LONG_TEXT, chunk_size=size, chunk_overlap=overlap)
+        assert len(chunks) > 1
+        assert max(len(c) for c in chunks) <= size * 1.2  # Allow some overflow for overlap
+
+    # Chunk count drives embedding cost; these budgets pin today's output
+    @pytest.mark.parametrize("size,overlap,max_chunks", [(500, 50, 40), (1000, 100, 20)])
+    def test_chunk_budget(self, size, overlap, max_chunks):
+        from ingestion.pipeline import chunk_text
+        chunks = chunk_text(_LONG_TEXT, chunk_size=size, chunk_overlap=overlap)
+        assert len(chunks) <= max_chunks
+
+    def test_chunker_short_text_single_chunk(self):
+        from ingestion.pipeline import chunk_text
+        short = "This is a very short document."
+        chunks = chunk_text(short, chunk_size=1000, chunk_overlap=100)
+        assert len(chunks) == 1
+        assert chunks[0] == short
+
+    def test_chunker_preserves_content(self):
+        from ingestion.pipeline import chunk_text
+        text = "Alpha paragraph.\n\nBeta paragraph.\n\nGamma paragraph."
+        chunks = chunk_text(text, chunk_size=200, chunk_overlap=20)
+        full = " ".join(chunks)
+        assert "Alpha" in full
+        assert "Beta" in full
+        assert "Gamma" in full
+
+    def test_rrf_prefers_chunks_ranked_by_both(self):
+        from ingestion.pipeline import reciprocal_rank_fusion
+        semantic = [{"content": "A"}, {"content": "B"}, {"content": "C"}]
+        keyword = [{"content": "B"}, {"content": "C"}]
+        fused = [r["content"] for r in reciprocal_rank_fusion([semantic, keyword])]
+        assert fused[0] == "B"
+        assert set(fused) == {"A", "B", "C"}
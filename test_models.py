@@ -0,0 +1,79 @@
+"""
+tests/test_models.py
+====================
+Model tests for the AI Readiness Advisor.
+All tests run without a live Anthropic API key.
+
+Run: pytest tests/ -n auto
+"""
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from models import get_maturity, Dimension, DimensionScore, AssessmentReport
+
+
+class TestModels:
+
+    @pytest.mark.parametrize("score,label,color", [
+        (1.5, "Nascent", "red"),
+        (9.5, "Leading", "blue"),
+        (4.0, "Developing", None),   # Exactly at 4.0 should be Developing
+    ])
+    def test_get_maturity(self, score, label, color):
+        lbl, clr, _ = get_maturity(score)
+        assert lbl == label
+        if color:
+            assert clr == color
+
+    def test_dimension_score_valid(self):
+        ds = DimensionScore(
+            dimension=Dimension.DATA_READINESS,
+            score=6.5,
+            maturity_level="Developing",
+            maturity_color="yellow",
+            key_strengths=["Good data warehouse"],
+            key_gaps=["No data catalogue"],
+            recommendations=["Implement data catalogue"],
+        )
+        assert ds.score == 6.5
+        assert ds.maturity_level == "Developing"
+
+    def test_dimension_score_invalid_range(self):
+        with pytest.raises(ValidationError):
+            DimensionScore(
+                dimension=Dimension.DATA_READINESS,
+                score=11.0,  # Invalid: > 10
+                maturity_level="Leading",
+                maturity_color="blue",
+            )
+
+    def test_assessment_report_serialisable(self):
+        ds = DimensionScore(
+            dimension=Dimension.DATA_READINESS,
+            score=5.0,
+            maturity_level="Developing",
+            maturity_color="yellow",
+        )
+        report = AssessmentReport(
+            report_id="RPT-TEST001",
+            organisation_name="Test Corp",
+            documents_analysed=["doc1.pdf"],
+            total_pages_analysed=10,
+            overall_score=5.0,
+            overall_maturity="Developing",
+            overall_maturity_color="yellow",
+            executive_summary="Test summary.",
+            dimension_scores=[ds],
+            use_case_candidates=[],
+            roadmap_phases=[],
+            critical_blockers=["Blocker 1"],
+            quick_wins=["Quick win 1"],
+        )
+        # Serialised to JSON in one pass by pydantic-core
+        json_str = report.model_dump_json()
+        assert "Test Corp" in json_str
+        dumped = orjson.loads(json_str)
+        assert dumped["organisation_name"] == "Test Corp"
+        assert dumped["overall_score"] == 5.0